@@ -9,22 +9,43 @@ This module must NOT be imported from ``oqtopus/__init__.py`` so that the
 QGIS plugin import path stays minimal and always exposes ``classFactory``.
 """
 
+import importlib.util
 import sys
 import types
 
+
+def _lazy_import(name):
+    """Import a pure-Python module lazily, it is executed on first attribute access.
+
+    Qt binding extension modules (QtCore, QtGui, ...) are initialised as soon as
+    they are created so they gain nothing from this and are imported eagerly.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 if "qgis" not in sys.modules:
     try:
         pyqt_core = __import__("PyQt6.QtCore", fromlist=[""])
         pyqt_gui = __import__("PyQt6.QtGui", fromlist=[""])
         pyqt_network = __import__("PyQt6.QtNetwork", fromlist=[""])
         pyqt_widgets = __import__("PyQt6.QtWidgets", fromlist=[""])
-        pyqt_uic = __import__("PyQt6.uic", fromlist=[""])
+        pyqt_uic = _lazy_import("PyQt6.uic")
     except ModuleNotFoundError:
         pyqt_core = __import__("PyQt5.QtCore", fromlist=[""])
         pyqt_gui = __import__("PyQt5.QtGui", fromlist=[""])
         pyqt_network = __import__("PyQt5.QtNetwork", fromlist=[""])
         pyqt_widgets = __import__("PyQt5.QtWidgets", fromlist=[""])
-        pyqt_uic = __import__("PyQt5.uic", fromlist=[""])
+        pyqt_uic = _lazy_import("PyQt5.uic")
 
     qgis = types.ModuleType("qgis")
     pyqt = types.ModuleType("qgis.PyQt")
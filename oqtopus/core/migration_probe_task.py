@@ -0,0 +1,56 @@
+"""Background task reading the installed module state from the migration table."""
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+from qgis.PyQt.QtCore import QThread, pyqtSignal
+
+from ..libs.pum.schema_migrations import SchemaMigrations
+
+
+def probe_migrations(schema_migrations: SchemaMigrations, connection: psycopg.Connection):
+    """Return the migration summary and the baseline version of the installed module.
+
+    Both are None if the module is not installed in the database.
+    """
+    if not schema_migrations.exists(connection):
+        return None, None
+    return schema_migrations.migration_summary(connection), schema_migrations.baseline(connection)
+
+
+class MigrationProbeTask(QThread):
+    """
+    Background task for reading the migration table of a module.
+    This keeps the UI responsive while querying a slow or remote database.
+    """
+
+    signalFinished = pyqtSignal(object, object, object)  # migration_summary, baseline, exception
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.__schema_migrations = None
+        self.__conninfo = None
+
+    def start_probe(self, schema_migrations: SchemaMigrations, connection: psycopg.Connection):
+        """Start reading the migration table.
+
+        The thread opens its own short-lived connection with the parameters of
+        *connection*, which stays free for the GUI thread.
+        """
+        self.__schema_migrations = schema_migrations
+        self.__conninfo = make_conninfo(connection.info.dsn, password=connection.info.password)
+        self.start()
+
+    def run(self):
+        migration_summary = None
+        baseline = None
+        error = None
+        try:
+            with psycopg.connect(self.__conninfo) as connection:
+                migration_summary, baseline = probe_migrations(
+                    self.__schema_migrations, connection
+                )
+        except Exception as exception:
+            error = exception
+
+        self.signalFinished.emit(migration_summary, baseline, error)
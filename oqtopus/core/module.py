@@ -19,6 +19,41 @@ from .module_package import ModulePackage
 # Cache duration in seconds (1 hour)
 CACHE_DURATION = 3600
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Largest page size allowed by the GitHub REST API
+GITHUB_PER_PAGE = 100
+
+# Abort GitHub API requests stalling for longer than this (in milliseconds)
+GITHUB_TRANSFER_TIMEOUT = 30000
+
+# Open pull requests and the main branch head in a single GraphQL round-trip.
+# Only used with a token, the GraphQL API does not allow anonymous access.
+DEVELOPMENT_VERSIONS_FRAGMENT = """
+fragment DevelopmentVersions on Repository {
+  mainBranch: ref(qualifiedName: "refs/heads/main") {
+    target { oid }
+  }
+  pullRequests(states: OPEN, first: 30, orderBy: {field: CREATED_AT, direction: DESC}) {
+    nodes {
+      number
+      title
+      createdAt
+      url
+      headRefName
+      headRefOid
+      headRepository { name isFork owner { login } }
+    }
+  }
+}
+"""
+
+DEVELOPMENT_VERSIONS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { ...DevelopmentVersions }
+}
+""" + DEVELOPMENT_VERSIONS_FRAGMENT
+
 
 class Module(QObject):
     signal_versionsLoaded = pyqtSignal(str)
@@ -60,7 +95,11 @@ class Module(QObject):
         cache_file = os.path.join(self.__get_cache_dir(), f"{cache_type}.json")
         return cache_file
 
-    def __read_cache(self, cache_type):
+    def __get_etag_file(self, cache_type):
+        """Get the file path storing the ETag of a cached response."""
+        return os.path.join(self.__get_cache_dir(), f"{cache_type}.etag")
+
+    def __read_cache(self, cache_type, ignore_expiry=False):
         """Read cached data if it exists and is not expired."""
         cache_file = self.__get_cache_file(cache_type)
         if not os.path.exists(cache_file):
@@ -68,7 +107,7 @@ class Module(QObject):
 
         # Check if cache is expired
         file_age = time.time() - os.path.getmtime(cache_file)
-        if file_age > CACHE_DURATION:
+        if file_age > CACHE_DURATION and not ignore_expiry:
             return None
 
         try:
@@ -82,15 +121,185 @@ class Module(QObject):
             logger.warning(f"Failed to read cache for {cache_type}: {e}")
             return None
 
-    def __write_cache(self, cache_type, data):
-        """Write data to cache file."""
+    def __has_valid_cache(self, cache_type):
+        """Check if a non-expired cache file exists."""
+        cache_file = self.__get_cache_file(cache_type)
+        if not os.path.exists(cache_file):
+            return False
+        return time.time() - os.path.getmtime(cache_file) <= CACHE_DURATION
+
+    def __read_etag(self, cache_type):
+        """Read the ETag of the cached response, if any."""
+        etag_file = self.__get_etag_file(cache_type)
+        if not os.path.exists(etag_file) or not os.path.exists(self.__get_cache_file(cache_type)):
+            return None
+        try:
+            with open(etag_file, encoding="utf-8") as f:
+                return f.read().strip() or None
+        except Exception as e:
+            logger.warning(f"Failed to read ETag for {cache_type}: {e}")
+            return None
+
+    def __discard_etag(self, cache_type):
+        """Remove the ETag of a cached response that can't be read back.
+
+        Returns True if there was one, the request can then be sent again without
+        If-None-Match.
+        """
+        etag_file = self.__get_etag_file(cache_type)
+        if not os.path.exists(etag_file):
+            return False
+        try:
+            os.remove(etag_file)
+        except OSError as e:
+            logger.warning(f"Failed to remove ETag for {cache_type}: {e}")
+            return False
+        logger.warning(f"Cached {cache_type} data is missing, requesting it again")
+        return True
+
+    def __write_cache(self, cache_type, data, etag=None):
+        """Write data (and its ETag if provided) to cache file."""
         cache_file = self.__get_cache_file(cache_type)
+        etag_file = self.__get_etag_file(cache_type)
         try:
             with open(cache_file, "w", encoding="utf-8") as f:
                 json.dump(data, f)
+            if etag:
+                with open(etag_file, "w", encoding="utf-8") as f:
+                    f.write(etag)
+            elif os.path.exists(etag_file):
+                os.remove(etag_file)
         except Exception as e:
             logger.warning(f"Failed to write cache for {cache_type}: {e}")
 
+    def __refresh_cache(self, cache_type):
+        """Read back a cached response GitHub reported as not modified (HTTP 304).
+
+        The cache file timestamp is refreshed so it stays valid for another
+        CACHE_DURATION.
+        """
+        data = self.__read_cache(cache_type, ignore_expiry=True)
+        if data is not None:
+            try:
+                os.utime(self.__get_cache_file(cache_type))
+            except OSError as e:
+                logger.warning(f"Failed to refresh cache for {cache_type}: {e}")
+        return data
+
+    def __get_github(self, url, cache_type=None):
+        """Send a GET request to the GitHub API.
+
+        If a previous response is cached, its ETag is sent as If-None-Match so
+        GitHub can answer with 304 Not Modified, which does not count against
+        the rate limit.
+        """
+        request = QNetworkRequest(QUrl(url))
+        request.setTransferTimeout(GITHUB_TRANSFER_TIMEOUT)
+        headers = Settings.get_github_headers()
+        etag = self.__read_etag(cache_type) if cache_type else None
+        if etag:
+            headers["If-None-Match"] = etag
+        for key, value in headers.items():
+            request.setRawHeader(QByteArray(key.encode()), QByteArray(value.encode()))
+        return self.network_manager.get(request)
+
+    def __post_github_graphql(self, query, variables):
+        """Send a query to the GitHub GraphQL API."""
+        request = QNetworkRequest(QUrl(GITHUB_GRAPHQL_URL))
+        request.setTransferTimeout(GITHUB_TRANSFER_TIMEOUT)
+        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
+        for key, value in Settings.get_github_headers().items():
+            request.setRawHeader(QByteArray(key.encode()), QByteArray(value.encode()))
+        body = json.dumps({"query": query, "variables": variables})
+        return self.network_manager.post(request, QByteArray(body.encode()))
+
+    def __read_reply(self, reply, cache_type):
+        """Return the JSON data of a GitHub API reply and update the cache.
+
+        Returns None if the reply is not modified but the cached data can't be read,
+        the request must then be sent again.
+        """
+        status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if status_code == 304:
+            data = self.__refresh_cache(cache_type)
+            if data is not None:
+                logger.info(f"GitHub {cache_type} data not modified, using cache")
+                return data
+            if self.__discard_etag(cache_type):
+                return None
+            raise Exception(f"GitHub {cache_type} data not modified but not cached")
+
+        data = json.loads(reply.readAll().data().decode())
+        etag = reply.rawHeader(QByteArray(b"ETag")).data().decode()
+        self.__write_cache(cache_type, data, etag)
+        return data
+
+    def __get_github_pages(self, url, cache_type, on_finished):
+        """Send a GET request for a paginated GitHub API list.
+
+        The pages are followed using the Link header and on_finished is called
+        with the items of all pages and an error message (empty on success).
+        Only the first page is sent with the cached ETag: when it is not
+        modified, the cached items of all pages are used.
+        """
+        reply = self.__get_github(url, cache_type)
+        reply.finished.connect(
+            lambda: self.__on_github_page_reply(reply, cache_type, on_finished, [], None)
+        )
+
+    def __on_github_page_reply(self, reply, cache_type, on_finished, items, etag):
+        first_page = etag is None
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise Exception(reply.errorString())
+
+            status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+            if first_page and status_code == 304:
+                data = self.__refresh_cache(cache_type)
+                if data is not None:
+                    logger.info(f"GitHub {cache_type} data not modified, using cache")
+                    reply.deleteLater()
+                    on_finished(data, "")
+                    return
+                if self.__discard_etag(cache_type):
+                    reply.deleteLater()
+                    self.__get_github_pages(reply.url().toString(), cache_type, on_finished)
+                    return
+                raise Exception(f"GitHub {cache_type} data not modified but not cached")
+
+            if first_page:
+                etag = reply.rawHeader(QByteArray(b"ETag")).data().decode()
+
+            items.extend(json.loads(reply.readAll().data().decode()))
+            next_url = Module.__next_page_url(reply)
+        except Exception as e:
+            reply.deleteLater()
+            on_finished(None, str(e))
+            return
+
+        reply.deleteLater()
+        if next_url:
+            next_reply = self.__get_github(next_url)
+            next_reply.finished.connect(
+                lambda: self.__on_github_page_reply(
+                    next_reply, cache_type, on_finished, items, etag
+                )
+            )
+            return
+
+        self.__write_cache(cache_type, items, etag)
+        on_finished(items, "")
+
+    @staticmethod
+    def __next_page_url(reply):
+        """Return the URL of the next page from the Link header of a reply, if any."""
+        link = reply.rawHeader(QByteArray(b"Link")).data().decode()
+        for part in link.split(","):
+            match = re.match(r'\s*<([^>]+)>\s*;\s*rel="next"', part)
+            if match:
+                return match.group(1)
+        return None
+
     def start_load_versions(self):
         # Read cache asynchronously to avoid blocking UI
         QTimer.singleShot(0, self.__async_load_versions)
@@ -108,32 +317,19 @@ class Module(QObject):
                 logger.warning(f"Failed to process cached releases: {e}")
 
         # Cache miss or invalid - fetch from API
-        url = f"https://api.github.com/repos/{self.organisation}/{self.repository}/releases"
+        url = f"https://api.github.com/repos/{self.organisation}/{self.repository}/releases?per_page={GITHUB_PER_PAGE}"
         logger.info(f"Loading versions from '{url}'...")
-        request = QNetworkRequest(QUrl(url))
-        headers = Settings.get_github_headers()
-        for key, value in headers.items():
-            request.setRawHeader(QByteArray(key.encode()), QByteArray(value.encode()))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_versions_reply(reply))
+        self.__get_github_pages(url, "releases", self._on_versions_loaded)
 
-    def _on_versions_reply(self, reply):
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            self.signal_versionsLoaded.emit(reply.errorString())
-            reply.deleteLater()
+    def _on_versions_loaded(self, json_versions, error):
+        if error:
+            self.signal_versionsLoaded.emit(error)
             return
         try:
-            data = reply.readAll().data()
-            json_versions = json.loads(data.decode())
-
-            # Cache the response
-            self.__write_cache("releases", json_versions)
-
             self._process_versions_data(json_versions)
             self.signal_versionsLoaded.emit("")
         except Exception as e:
             self.signal_versionsLoaded.emit(str(e))
-        reply.deleteLater()
 
     def _process_versions_data(self, json_versions):
         """Process versions data from cache or API response."""
@@ -192,26 +388,97 @@ class Module(QObject):
             name="main",
             branch="main",
         )
-        # Fetch the latest commit SHA for caching (async to avoid blocking UI)
-        QTimer.singleShot(0, lambda: mainVersion.fetch_commit_sha())
         self.development_versions.append(mainVersion)
 
         # Try to load pull requests from cache first
         cached_data = self.__read_cache("pulls")
         if cached_data is not None:
+            # Fetch the latest commit SHA for caching (in a thread to avoid blocking UI)
+            mainVersion.start_fetch_commit_sha()
             # Process cache asynchronously to keep UI responsive
             QTimer.singleShot(0, lambda: self._process_cached_pulls(cached_data))
             return
 
         # Cache miss or invalid - fetch from API
+        if Settings.has_github_token():
+            # Pull requests and main commit SHA in a single GraphQL request
+            logger.info(
+                f"Loading pre-releases and development versions from '{GITHUB_GRAPHQL_URL}'..."
+            )
+            reply = self.__post_github_graphql(
+                DEVELOPMENT_VERSIONS_QUERY,
+                {"owner": self.organisation, "name": self.repository},
+            )
+            reply.finished.connect(
+                lambda: self._on_development_versions_graphql_reply(reply, mainVersion)
+            )
+            return
+
+        mainVersion.start_fetch_commit_sha()
+        self.__load_pull_requests()
+
+    @staticmethod
+    def start_prefetch_development_versions(modules):
+        """Fill the pull requests cache of several modules with a single GraphQL request.
+
+        Every repository is queried under its own alias (m0, m1, ...) so the whole
+        module list costs one round-trip. Modules with a valid cache are skipped.
+        Requires a GitHub token.
+        """
+        if not Settings.has_github_token():
+            return
+
+        modules = [module for module in modules if not module.__has_valid_cache("pulls")]
+        if not modules:
+            return
+
+        variables = {}
+        parameters = []
+        aliases = []
+        for i, module in enumerate(modules):
+            variables[f"owner{i}"] = module.organisation
+            variables[f"name{i}"] = module.repository
+            parameters.append(f"$owner{i}: String!, $name{i}: String!")
+            aliases.append(
+                f"m{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...DevelopmentVersions }}"
+            )
+        query = (
+            f"query({', '.join(parameters)}) {{\n  "
+            + "\n  ".join(aliases)
+            + "\n}\n"
+            + DEVELOPMENT_VERSIONS_FRAGMENT
+        )
+
+        logger.info(f"Prefetching development versions of {len(modules)} modules...")
+        reply = modules[0].__post_github_graphql(query, variables)
+        reply.finished.connect(lambda: Module.__on_prefetch_reply(reply, modules))
+
+    @staticmethod
+    def __on_prefetch_reply(reply, modules):
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise Exception(reply.errorString())
+
+            # Repositories that can't be resolved come back as null with
+            # partial errors, the others are still usable
+            data = json.loads(reply.readAll().data().decode()).get("data") or {}
+            for i, module in enumerate(modules):
+                repository = data.get(f"m{i}")
+                if repository is None:
+                    continue
+                json_versions = [
+                    Module.__pull_request_from_graphql(node)
+                    for node in repository["pullRequests"]["nodes"]
+                ]
+                module.__write_cache("pulls", json_versions)
+        except Exception as e:
+            logger.warning(f"Failed to prefetch development versions: {e}")
+        reply.deleteLater()
+
+    def __load_pull_requests(self):
         url = f"https://api.github.com/repos/{self.organisation}/{self.repository}/pulls"
         logger.info(f"Loading pre-releases and development versions from '{url}'...")
-
-        request = QNetworkRequest(QUrl(url))
-        headers = Settings.get_github_headers()
-        for key, value in headers.items():
-            request.setRawHeader(QByteArray(key.encode()), QByteArray(value.encode()))
-        reply = self.network_manager.get(request)
+        reply = self.__get_github(url, "pulls")
         reply.finished.connect(lambda: self._on_development_versions_reply(reply))
 
     def _process_cached_pulls(self, cached_data):
@@ -222,14 +489,7 @@ class Module(QObject):
         except Exception as e:
             logger.warning(f"Failed to process cached pull requests: {e}")
             # On error, continue with API call
-            url = f"https://api.github.com/repos/{self.organisation}/{self.repository}/pulls"
-            logger.info(f"Loading pre-releases and development versions from '{url}'...")
-            request = QNetworkRequest(QUrl(url))
-            headers = Settings.get_github_headers()
-            for key, value in headers.items():
-                request.setRawHeader(QByteArray(key.encode()), QByteArray(value.encode()))
-            reply = self.network_manager.get(request)
-            reply.finished.connect(lambda: self._on_development_versions_reply(reply))
+            self.__load_pull_requests()
 
     def _on_development_versions_reply(self, reply):
         if reply.error() != QNetworkReply.NetworkError.NoError:
@@ -238,18 +498,70 @@ class Module(QObject):
             return
 
         try:
-            data = reply.readAll().data()
-            json_versions = json.loads(data.decode())
+            json_versions = self.__read_reply(reply, "pulls")
+            if json_versions is None:
+                self.__load_pull_requests()
+            else:
+                self._process_pull_requests_data(json_versions)
+                self.signal_developmentVersionsLoaded.emit("")
+        except Exception as e:
+            self.signal_developmentVersionsLoaded.emit(str(e))
+        reply.deleteLater()
 
-            # Cache the response
-            self.__write_cache("pulls", json_versions)
+    def _on_development_versions_graphql_reply(self, reply, main_version):
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise Exception(reply.errorString())
+
+            payload = json.loads(reply.readAll().data().decode())
+            if payload.get("errors"):
+                raise Exception(payload["errors"][0].get("message"))
+
+            repository = payload["data"]["repository"]
+            json_versions = [
+                Module.__pull_request_from_graphql(node)
+                for node in repository["pullRequests"]["nodes"]
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to load development versions using GraphQL: {e}")
+            reply.deleteLater()
+            # Fall back to the REST API
+            main_version.start_fetch_commit_sha()
+            self.__load_pull_requests()
+            return
 
+        if repository.get("mainBranch"):
+            main_version.commit_sha = repository["mainBranch"]["target"]["oid"]
+
+        try:
+            # Cached in the same shape as the REST response
+            self.__write_cache("pulls", json_versions)
             self._process_pull_requests_data(json_versions)
             self.signal_developmentVersionsLoaded.emit("")
         except Exception as e:
             self.signal_developmentVersionsLoaded.emit(str(e))
         reply.deleteLater()
 
+    @staticmethod
+    def __pull_request_from_graphql(node):
+        """Convert a GraphQL pull request node into the REST /pulls payload format."""
+        head_repository = node["headRepository"] or {}
+        return {
+            "number": node["number"],
+            "title": node["title"],
+            "created_at": node["createdAt"],
+            "html_url": node["url"],
+            "head": {
+                "ref": node["headRefName"],
+                "sha": node["headRefOid"],
+                "repo": {
+                    "fork": head_repository.get("isFork", False),
+                    "name": head_repository.get("name"),
+                    "owner": {"login": (head_repository.get("owner") or {}).get("login")},
+                },
+            },
+        }
+
     def _process_pull_requests_data(self, json_versions):
         """Process pull requests data from cache or API response."""
         for json_version in json_versions:
@@ -125,6 +125,7 @@ class ModuleOperationTask(QThread):
             # Create feedback instance that emits signals
             self.__feedback = self._create_feedback()
 
+            self.__checkForCanceled()
             upgrader = Upgrader(config=self.__pum_config)
 
             if self.__operation == "install":
@@ -142,8 +143,10 @@ class ModuleOperationTask(QThread):
             else:
                 raise Exception(f"Unknown operation: {self.__operation}")
 
-            # Commit if successful and not canceled
-            if not self.__canceled and self.__options.get("commit", True):
+            # Don't commit if canceled during the last step
+            self.__checkForCanceled()
+
+            if self.__options.get("commit", True):
                 logger.info("Committing changes to database...")
                 self.__connection.commit()
                 logger.info("Changes committed to the database.")
@@ -151,19 +154,35 @@ class ModuleOperationTask(QThread):
             logger.info(f"Operation '{self.__operation}' completed successfully")
             self.signalFinished.emit(True, "")
 
+        except ModuleOperationCanceled:
+            logger.warning(f"Operation '{self.__operation}' canceled")
+            self.__rollback()
+            self.signalFinished.emit(False, "")
+
         except Exception as e:
             logger.critical(f"Module operation error in '{self.__operation}': {e}")
             logger.exception("Full traceback:")  # Log full stack trace
             self.__error_message = str(e)
             # Rollback on error
-            try:
-                logger.info("Rolling back transaction...")
-                self.__connection.rollback()
-                logger.info("Transaction rolled back")
-            except Exception as rollback_error:
-                logger.error(f"Rollback failed: {rollback_error}")
+            self.__rollback()
             self.signalFinished.emit(False, self.__error_message)
 
+    def __rollback(self):
+        try:
+            logger.info("Rolling back transaction...")
+            self.__connection.rollback()
+            logger.info("Transaction rolled back")
+        except Exception as rollback_error:
+            logger.error(f"Rollback failed: {rollback_error}")
+
+    def __checkForCanceled(self):
+        """
+        Check if the operation has been canceled, between the steps run by this task.
+        Within a step, pum checks for cancellation through the feedback.
+        """
+        if self.__canceled:
+            raise ModuleOperationCanceled("The operation has been canceled.")
+
     def _run_install(self, upgrader: Upgrader):
         """Run install operation."""
         # Extract options that should not be passed to install()
@@ -186,10 +205,12 @@ class ModuleOperationTask(QThread):
         )
 
         if suffix:
+            self.__checkForCanceled()
             self._create_roles_with_options(suffix=suffix)
 
         # Install demo data if requested
         if install_demo_data and demo_data_name:
+            self.__checkForCanceled()
             upgrader.install_demo_data(
                 connection=self.__connection,
                 name=demo_data_name,
@@ -212,6 +233,7 @@ class ModuleOperationTask(QThread):
         )
 
         if suffix:
+            self.__checkForCanceled()
             self._create_roles_with_options(suffix=suffix)
 
     def _run_uninstall(self, upgrader: Upgrader):
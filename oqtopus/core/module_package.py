@@ -1,10 +1,23 @@
-import requests
-from qgis.PyQt.QtCore import QDateTime, Qt
+from datetime import datetime
 
+from qgis.PyQt.QtCore import QRunnable, QThreadPool
+
+from ..utils.plugin_utils import PluginUtils
 from .module_asset import ModuleAsset
 from .settings import Settings
 
 
+class FetchCommitShaRunnable(QRunnable):
+    """Fetches the commit SHA of a package in a thread pool thread."""
+
+    def __init__(self, module_package):
+        super().__init__()
+        self.module_package = module_package
+
+    def run(self):
+        self.module_package.fetch_commit_sha()
+
+
 class ModulePackage:
 
     # enum for package type
@@ -15,6 +28,12 @@ class ModulePackage:
         FROM_ZIP = "from_zip"
         FROM_DIRECTORY = "from_directory"
 
+    # Attribute holding the release asset for each asset label
+    RELEASE_ASSET_ATTRIBUTES = {
+        ModuleAsset.Type.PROJECT.value: "asset_project",
+        ModuleAsset.Type.PLUGIN.value: "asset_plugin",
+    }
+
     def __init__(
         self,
         module,
@@ -56,11 +75,20 @@ class ModulePackage:
         else:
             raise ValueError(f"Unknown type '{type}'")
 
-        type = "heads"
-        if self.type == ModulePackage.Type.RELEASE:
-            type = "tags"
+    @property
+    def download_url(self):
+        """URL of the source archive, only built when a package is actually downloaded.
 
-        self.download_url = f"https://github.com/{self.organisation}/{self.repository}/archive/refs/{type}/{self.branch}.zip"
+        None for packages loaded from a local zip file or directory.
+        """
+        if self.branch is None or self.type not in (
+            ModulePackage.Type.RELEASE,
+            ModulePackage.Type.BRANCH,
+            ModulePackage.Type.PULL_REQUEST,
+        ):
+            return None
+        ref_type = "tags" if self.type == ModulePackage.Type.RELEASE else "heads"
+        return f"https://github.com/{self.organisation}/{self.repository}/archive/refs/{ref_type}/{self.branch}.zip"
 
     def display_name(self):
         if self.prerelease:
@@ -77,7 +105,9 @@ class ModulePackage:
             # For branches: use refs/heads/{branch}
             # For PRs: use refs/heads/{branch} from the head repo
             url = f"https://api.github.com/repos/{self.organisation}/{self.repository}/commits/{self.branch}"
-            r = requests.get(url, headers=Settings.get_github_headers(), timeout=10)
+            r = PluginUtils.github_session().get(
+                url, headers=Settings.get_github_headers(), timeout=10
+            )
             r.raise_for_status()
             commit_data = r.json()
             self.commit_sha = commit_data["sha"]
@@ -88,6 +118,10 @@ class ModulePackage:
             logger.warning(f"Failed to fetch commit SHA for branch '{self.branch}': {e}")
             self.commit_sha = None
 
+    def start_fetch_commit_sha(self):
+        """Fetch the latest commit SHA in the background, without blocking the GUI thread."""
+        QThreadPool.globalInstance().start(FetchCommitShaRunnable(self))
+
     def fetch_workflow_assets(self):
         """Fetch workflow artifact URLs for branch/PR packages from GitHub Actions API.
 
@@ -110,7 +144,7 @@ class ModulePackage:
                 f"https://api.github.com/repos/{self.organisation}/{self.repository}"
                 f"/actions/runs?branch={self.branch}&status=success&per_page=5"
             )
-            r = requests.get(url, headers=headers, timeout=10)
+            r = PluginUtils.github_session().get(url, headers=headers, timeout=10)
             r.raise_for_status()
             runs = r.json().get("workflow_runs", [])
 
@@ -121,7 +155,7 @@ class ModulePackage:
             # Check each run (most recent first) for matching artifacts
             for run in runs:
                 artifacts_url = run["artifacts_url"]
-                r = requests.get(artifacts_url, headers=headers, timeout=10)
+                r = PluginUtils.github_session().get(artifacts_url, headers=headers, timeout=10)
                 r.raise_for_status()
                 artifacts = r.json().get("artifacts", [])
 
@@ -172,6 +206,14 @@ class ModulePackage:
         except Exception as e:
             logger.warning(f"Failed to fetch workflow artifacts for branch '{self.branch}': {e}")
 
+    @staticmethod
+    def __parse_datetime(value: str) -> datetime:
+        """Parse a GitHub ISO 8601 timestamp (e.g. 2024-01-31T12:00:00Z)."""
+        if value.endswith("Z"):
+            # fromisoformat only accepts the Z suffix from Python 3.11
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
     def __parse_release(self, json_payload: dict):
         if self.name is None:
             self.name = json_payload["name"]
@@ -180,7 +222,7 @@ class ModulePackage:
             self.name = json_payload["tag_name"]
 
         self.branch = self.name
-        self.created_at = QDateTime.fromString(json_payload["created_at"], Qt.DateFormat.ISODate)
+        self.created_at = ModulePackage.__parse_datetime(json_payload["created_at"])
         self.prerelease = json_payload["prerelease"]
         self.html_url = json_payload["html_url"]
 
@@ -190,34 +232,29 @@ class ModulePackage:
     def __parse_release_assets(self, json_assets: list):
         """Parse release assets from the already-fetched release data."""
         for json_asset in json_assets:
+            if self.asset_project and self.asset_plugin:
+                # We already have all assets we need
+                break
+
+            attribute = self.RELEASE_ASSET_ATTRIBUTES.get(json_asset["label"])
+            if attribute is None:
+                continue
+
             asset = ModuleAsset(
                 name=json_asset["name"],
                 label=json_asset["label"],
                 download_url=json_asset["browser_download_url"],
                 size=json_asset["size"],
-                type=None,
+                type=ModuleAsset.Type(json_asset["label"]),
             )
-
-            if asset.label == ModuleAsset.Type.PROJECT.value:
-                asset.type = ModuleAsset.Type.PROJECT
-                self.asset_project = asset
-                continue
-
-            if asset.label == ModuleAsset.Type.PLUGIN.value:
-                asset.type = ModuleAsset.Type.PLUGIN
-                self.asset_plugin = asset
-                continue
-
-            if self.asset_project and self.asset_plugin:
-                # We already have all assets we need
-                break
+            setattr(self, attribute, asset)
 
     def __parse_pull_request(self, json_payload: dict):
         if self.name is None:
             self.name = f"#{json_payload['number']} {json_payload['title']}"
         self.branch = json_payload["head"]["ref"]
         self.commit_sha = json_payload["head"]["sha"]
-        self.created_at = QDateTime.fromString(json_payload["created_at"], Qt.DateFormat.ISODate)
+        self.created_at = ModulePackage.__parse_datetime(json_payload["created_at"])
         self.prerelease = False
         self.html_url = json_payload["html_url"]
 
@@ -103,7 +103,7 @@ class PackagePrepareTask(QThread):
             if self.from_directory:
                 if not os.path.isdir(self.from_directory):
                     raise Exception(
-                        self.tr(f"The directory '{self.from_directory}' does not exist.")
+                        self.tr("The directory '%s' does not exist.") % self.from_directory
                     )
                 self.module_package.source_package_dir = self.from_directory
                 self.lastError = None
@@ -288,7 +288,9 @@ class PackagePrepareTask(QThread):
                 headers = {}
                 if "api.github.com" in url:
                     headers = Settings.get_github_headers()
-                response = requests.head(url, headers=headers, allow_redirects=True, timeout=10)
+                response = PluginUtils.github_session().head(
+                    url, headers=headers, allow_redirects=True, timeout=10
+                )
                 content_length = response.headers.get("content-length")
                 if content_length:
                     file_size = int(content_length)
@@ -425,7 +427,7 @@ class PackagePrepareTask(QThread):
             headers = {}
             if "api.github.com" in url:
                 headers = Settings.get_github_headers()
-            response = requests.get(
+            response = PluginUtils.github_session().get(
                 url,
                 headers=headers,
                 allow_redirects=True,
@@ -487,25 +489,23 @@ class PackagePrepareTask(QThread):
         # Unzip the file to plugin temp dir
         # Don't set indeterminate here - it confuses the progress when downloading multiple files
 
+        # Use short name to avoid Windows MAX_PATH issues
+        package_dir = os.path.join(self.__destination_directory, subdir)
+
+        # Check if already extracted and valid, before reading the zip at all
+        if os.path.isdir(package_dir):
+            # Verify it's not empty and has some expected content
+            if os.listdir(package_dir):
+                logger.info(f"Directory '{package_dir}' already extracted - skipping extraction")
+                return package_dir
+            else:
+                logger.warning(f"Directory '{package_dir}' is empty, will re-extract")
+                shutil.rmtree(package_dir)
+
         try:
             with zipfile.ZipFile(zip_file, "r") as zip_ref:
                 names = zip_ref.namelist()
 
-                # Use short name to avoid Windows MAX_PATH issues
-                package_dir = os.path.join(self.__destination_directory, subdir)
-
-                # Check if already extracted and valid
-                if os.path.exists(package_dir) and os.path.isdir(package_dir):
-                    # Verify it's not empty and has some expected content
-                    if os.listdir(package_dir):
-                        logger.info(
-                            f"Directory '{package_dir}' already extracted - skipping extraction"
-                        )
-                        return package_dir
-                    else:
-                        logger.warning(f"Directory '{package_dir}' is empty, will re-extract")
-                        shutil.rmtree(package_dir)
-
                 # Detect if the zip has a single common top-level directory
                 top_levels = {n.split("/")[0] for n in names if n}
                 has_common_root = len(top_levels) == 1 and all("/" in n for n in names if n)
@@ -513,12 +513,19 @@ class PackagePrepareTask(QThread):
                 logger.info(f"Extracting '{zip_file}'...")
 
                 if has_common_root:
-                    # Standard zip with a single root directory — extract then rename
-                    zip_dirname = top_levels.pop()
-                    zip_ref.extractall(self.__destination_directory)
-                    extracted_dir = os.path.join(self.__destination_directory, zip_dirname)
-                    if extracted_dir != package_dir:
-                        shutil.move(extracted_dir, package_dir)
+                    # Standard zip with a single root directory — extract its content
+                    # straight into subdir instead of extracting and renaming the root
+                    root_prefix = top_levels.pop() + "/"
+                    os.makedirs(package_dir, exist_ok=True)
+                    for member in zip_ref.infolist():
+                        relative_name = member.filename[len(root_prefix) :]
+                        if not relative_name:
+                            # The root directory entry itself
+                            continue
+                        # Only the extraction path changes, the data is still
+                        # located through the original name
+                        member.filename = relative_name
+                        zip_ref.extract(member, package_dir)
                 else:
                     # Flat zip (no common root) — extract directly into subdir
                     os.makedirs(package_dir, exist_ok=True)
@@ -527,7 +534,9 @@ class PackagePrepareTask(QThread):
                 logger.info(f"Extraction complete: '{package_dir}'")
 
         except zipfile.BadZipFile:
-            raise Exception(self.tr(f"The selected file '{zip_file}' is not a valid zip archive."))
+            raise Exception(
+                self.tr("The selected file '%s' is not a valid zip archive.") % zip_file
+            )
 
         return package_dir
 
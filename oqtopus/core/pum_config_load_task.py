@@ -0,0 +1,57 @@
+"""Background task loading the PUM config of a module package."""
+
+from pathlib import Path
+
+import yaml
+from qgis.PyQt.QtCore import QThread, pyqtSignal
+
+from ..libs.pum.pum_config import PumConfig
+
+try:
+    # libyaml based loader, much faster when PyYAML is built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+class PumConfigLoadTask(QThread):
+    """
+    Background task for reading the .pum.yaml file of a module package.
+    Parsing the YAML and installing the module dependencies can take a while,
+    this keeps the UI responsive when switching between module packages.
+    """
+
+    signalFinished = pyqtSignal(object, object, object)  # module_package, pum_config, exception
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.__module_package = None
+        self.__config_file = None
+
+    def start_load(self, module_package, config_file: str):
+        """Start loading the PUM config file of the given module package."""
+        self.__module_package = module_package
+        self.__config_file = config_file
+        self.start()
+
+    def run(self):
+        pum_config = None
+        error = None
+        try:
+            # Read at once, a missing file raises FileNotFoundError
+            config_data = yaml.load(Path(self.__config_file).read_bytes(), Loader=SafeLoader)
+
+            # since pum 1.3, the module id is mandatory in the pum config
+            if "pum" not in config_data:
+                config_data["pum"] = {}
+            if "module" not in config_data["pum"]:
+                config_data["pum"]["module"] = self.__module_package.module.id
+
+            pum_config = PumConfig(
+                base_path=Path(self.__config_file).parent, install_dependencies=True, **config_data
+            )
+        except Exception as exception:
+            error = exception
+
+        self.signalFinished.emit(self.__module_package, pum_config, error)
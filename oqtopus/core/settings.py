@@ -192,6 +192,9 @@ class Settings:
     # ------------------------------------------------------------------
     _AUTH_CFG_NAME = "oqtopus-github"
 
+    # Headers built from the token, cleared when a new token is stored
+    _github_headers = None
+
     @staticmethod
     def has_github_token() -> bool:
         """Return True if a GitHub token is configured.
@@ -208,6 +211,8 @@ class Settings:
     @staticmethod
     def store_github_token(token: str) -> None:
         """Store *token* in the QGIS auth DB (or QSettings in standalone)."""
+        Settings._github_headers = None
+
         if not HAS_QGS_SETTINGS:
             # Standalone – no auth DB available, fall back to plain text
             Settings()._github_token_legacy.setValue(token)
@@ -265,9 +270,15 @@ class Settings:
 
     @staticmethod
     def get_github_headers():
-        """Return HTTP headers dict with GitHub auth token if configured."""
-        token = Settings.get_github_token()
-        headers = {}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        return headers
+        """Return HTTP headers dict with GitHub auth token if configured.
+
+        The token is read from the auth DB until a read succeeds, a copy of the
+        cached headers is returned so callers can add their own. A missing or
+        unreadable token (e.g. cancelled master password prompt) is not cached.
+        """
+        if Settings._github_headers is None:
+            token = Settings.get_github_token()
+            if not token:
+                return {}
+            Settings._github_headers = {"Authorization": f"Bearer {token}"}
+        return dict(Settings._github_headers)
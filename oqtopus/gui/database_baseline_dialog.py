@@ -108,7 +108,7 @@ class DatabaseBaselineDialog(QDialog, DIALOG_UI):
                     )
 
         except Exception as e:
-            errorText = self.tr(f"Error setting baseline:\n{e}")
+            errorText = self.tr("Error setting baseline:\n%s") % e
             logger.error(errorText)
             self.__message_bar.pushError(errorText)
             return
@@ -218,7 +218,7 @@ class DatabaseConnectionWidget(QWidget, DIALOG_UI):
             self.db_moduleInfo_label.setText("Can't connect to service.")
             QtUtils.setForegroundColor(self.db_moduleInfo_label, PluginUtils.COLOR_WARNING)
             self.db_info_icon_label.setVisible(False)
-            errorText = self.tr(f"Can't connect to service '{service_name}':\n{exception}.")
+            errorText = self.tr("Can't connect to service '%s':\n%s.") % (service_name, exception)
             logger.error(errorText)
             return
 
@@ -330,7 +330,7 @@ class DatabaseConnectionWidget(QWidget, DIALOG_UI):
         self.db_services_comboBox.setCurrentText(created_service_name)
 
         MessageBar.pushSuccessToBar(
-            self, self.tr(f"Database and service '{created_service_name}' created successfully.")
+            self, self.tr("Database and service '%s' created successfully.") % created_service_name
         )
 
     def __duplicateDatabaseClicked(self):
@@ -353,7 +353,7 @@ class DatabaseConnectionWidget(QWidget, DIALOG_UI):
         self.db_services_comboBox.setCurrentText(created_service_name)
 
         MessageBar.pushSuccessToBar(
-            self, self.tr(f"Database duplicated to service '{created_service_name}'.")
+            self, self.tr("Database duplicated to service '%s'.") % created_service_name
         )
 
     def getInstalledModuleIds(self) -> list[str]:
@@ -457,7 +457,7 @@ class DatabaseConnectionWidget(QWidget, DIALOG_UI):
         self.db_services_comboBox.setCurrentText(service_name)
 
         MessageBar.pushSuccessToBar(
-            self, self.tr(f"Database created for service '{service_name}'.")
+            self, self.tr("Database created for service '%s'.") % service_name
         )
 
     def __dropDatabaseClicked(self):
@@ -477,9 +477,10 @@ class DatabaseConnectionWidget(QWidget, DIALOG_UI):
             self,
             self.tr("Drop database"),
             self.tr(
-                f"Are you sure you want to drop the database '{db_name}'?\n\n"
+                "Are you sure you want to drop the database '%s'?\n\n"
                 "This action cannot be undone!"
-            ),
+            )
+            % db_name,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
@@ -494,9 +495,9 @@ class DatabaseConnectionWidget(QWidget, DIALOG_UI):
 
             drop_database({"service": service_name, "dbname": "postgres"}, db_name)
 
-            MessageBar.pushSuccessToBar(self, self.tr(f"Database '{db_name}' has been dropped."))
+            MessageBar.pushSuccessToBar(self, self.tr("Database '%s' has been dropped.") % db_name)
         except Exception as e:
-            MessageBar.pushErrorToBar(self, self.tr(f"Failed to drop database: {e}"))
+            MessageBar.pushErrorToBar(self, self.tr("Failed to drop database: %s") % e)
 
         self.__serviceChanged()
 
@@ -164,7 +164,7 @@ class DatabaseCreateDialog(QDialog, DIALOG_UI):
                 create_database(self._get_connection_parameters(), new_database_name)
 
         except Exception as e:
-            errorText = self.tr(f"Error creating the new database:\n{e}.")
+            errorText = self.tr("Error creating the new database:\n%s.") % e
             logger.error(errorText)
             self.__message_bar.pushError(errorText)
             return
@@ -179,7 +179,7 @@ class DatabaseCreateDialog(QDialog, DIALOG_UI):
                 create_if_not_found=True,
             )
         except Exception as e:
-            errorText = self.tr(f"Error writing the service configuration:\n{e}.")
+            errorText = self.tr("Error writing the service configuration:\n%s.") % e
             logger.error(errorText)
             self.__message_bar.pushError(errorText)
             return
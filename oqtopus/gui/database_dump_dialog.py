@@ -99,7 +99,7 @@ class DatabaseDumpDialog(QDialog, DIALOG_UI):
                     format=dump_format,
                 )
         except Exception as e:
-            errorText = self.tr(f"Error dumping database:\n{e}")
+            errorText = self.tr("Error dumping database:\n%s") % e
             logger.error(errorText)
             self.__message_bar.pushError(errorText)
             return
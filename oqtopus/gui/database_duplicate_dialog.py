@@ -25,8 +25,9 @@
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import QDialog, QMessageBox
 
+from ..libs.pgserviceparser import ServiceNotFound
+from ..libs.pgserviceparser import conf_path as pgserviceparser_conf_path
 from ..libs.pgserviceparser import full_config as pgserviceparser_full_config
-from ..libs.pgserviceparser import service_config as pgserviceparser_service_config
 from ..libs.pgserviceparser import write_service as pgserviceparser_write_service
 from ..libs.pum.database import create_database
 from ..utils.plugin_utils import PluginUtils, logger
@@ -42,7 +43,15 @@ class DatabaseDuplicateDialog(QDialog, DIALOG_UI):
 
         self.existingService_label.setText(selected_service)
 
-        self.__existing_service_config = pgserviceparser_service_config(selected_service)
+        # Parse the service file once for the existing service settings
+        pg_service_config = pgserviceparser_full_config()
+        if selected_service not in pg_service_config:
+            raise ServiceNotFound(
+                service_name=selected_service,
+                existing_service_names=pg_service_config.sections(),
+                pg_service_filepath=pgserviceparser_conf_path(),
+            )
+        self.__existing_service_config = dict(pg_service_config[selected_service])
         self.existingDatabase_label.setText(self.__existing_service_config.get("dbname", ""))
 
         self.buttonBox.accepted.connect(self._accept)
@@ -65,21 +74,31 @@ class DatabaseDuplicateDialog(QDialog, DIALOG_UI):
         # Create new service configuration
         new_service_name = self.newService_lineEdit.text()
 
-        # Check if the new service name is already in use
+        # Check if the new service name is already in use, the service file may have
+        # changed while the dialog was open
         try:
             if new_service_name in pgserviceparser_full_config():
-                errorText = self.tr(f"Service name '{new_service_name}' is already in use.")
+                errorText = self.tr("Service name '%s' is already in use.") % new_service_name
                 logger.error(errorText)
                 QMessageBox.critical(self, "Error", errorText)
                 return
         except Exception as e:
-            errorText = self.tr(f"Error checking existing service names:\n{e}.")
+            errorText = self.tr("Error checking existing service names:\n%s.") % e
             logger.error(errorText)
             QMessageBox.critical(self, "Error", errorText)
             return
 
         # Duplicate the database
         new_database_name = self.newDatabase_lineEdit.text()
+        if new_database_name == self.__existing_service_config.get("dbname"):
+            errorText = (
+                self.tr("The new database name '%s' is the same as the existing one.")
+                % new_database_name
+            )
+            logger.error(errorText)
+            QMessageBox.critical(self, "Error", errorText)
+            return
+
         try:
             with OverrideCursor(Qt.CursorShape.WaitCursor):
                 create_database(
@@ -88,7 +107,7 @@ class DatabaseDuplicateDialog(QDialog, DIALOG_UI):
                     template=self.__existing_service_config.get("dbname"),
                 )
         except Exception as e:
-            errorText = self.tr(f"Error duplicating database:\n{e}.")
+            errorText = self.tr("Error duplicating database:\n%s.") % e
             logger.error(errorText)
             QMessageBox.critical(self, "Error", errorText)
             return
@@ -106,7 +125,7 @@ class DatabaseDuplicateDialog(QDialog, DIALOG_UI):
                 new_service_name, new_service_config, create_if_not_found=True
             )
         except Exception as e:
-            errorText = self.tr(f"Error writing new service configuration:\n{e}.")
+            errorText = self.tr("Error writing new service configuration:\n%s.") % e
             logger.error(errorText)
             QMessageBox.critical(self, "Error", errorText)
             return
@@ -91,7 +91,7 @@ class DatabaseRestoreDialog(QDialog, DIALOG_UI):
                     exclude_schema=exclude_schemas or None,
                 )
         except Exception as e:
-            errorText = self.tr(f"Error restoring database:\n{e}")
+            errorText = self.tr("Error restoring database:\n%s") % e
             logger.error(errorText)
             self.__message_bar.pushError(errorText)
             return
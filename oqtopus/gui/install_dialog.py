@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Mapping
 
 from qgis.PyQt.QtWidgets import (
     QCheckBox,
@@ -32,7 +33,7 @@ class InstallDialog(QDialog):
         parent=None,
     ):
         super().__init__(parent)
-        self.setWindowTitle(self.tr(f"Install {target_version}"))
+        self.setWindowTitle(self.tr("Install %s") % target_version)
         self.setMinimumWidth(400)
 
         layout = QVBoxLayout(self)
@@ -40,9 +41,10 @@ class InstallDialog(QDialog):
         # Description
         description = QLabel(
             self.tr(
-                f"You are about to install version <b>{target_version}</b>.\n\n"
+                "You are about to install version <b>%s</b>.\n\n"
                 "Please review the parameters and options below."
-            ),
+            )
+            % target_version,
             self,
         )
         description.setWordWrap(True)
@@ -51,18 +53,12 @@ class InstallDialog(QDialog):
         # Standard parameters
         self.__standard_groupbox = ParametersGroupBox(self)
         self.__standard_groupbox.setTitle(self.tr("Parameters"))
-        gb_layout = QVBoxLayout()
-        gb_layout.setContentsMargins(3, 3, 3, 3)
-        self.__standard_groupbox.setLayout(gb_layout)
         self.__standard_groupbox.setParameters(standard_params)
         layout.addWidget(self.__standard_groupbox)
 
         # App-only parameters
         self.__app_only_groupbox = ParametersGroupBox(self)
         self.__app_only_groupbox.setTitle(self.tr("Application parameters"))
-        gb_layout = QVBoxLayout()
-        gb_layout.setContentsMargins(3, 3, 3, 3)
-        self.__app_only_groupbox.setLayout(gb_layout)
         self.__app_only_groupbox.setParameters(app_only_params)
         layout.addWidget(self.__app_only_groupbox)
 
@@ -83,8 +79,10 @@ class InstallDialog(QDialog):
             lambda checked: self.__demo_data_combobox.setEnabled(checked)
         )
         if demo_data:
-            for name, file in demo_data.items():
-                self.__demo_data_combobox.addItem(name, file)
+            # Insert all rows at once, then attach the files as item data
+            self.__demo_data_combobox.addItems(list(demo_data.keys()))
+            for index, file in enumerate(demo_data.values()):
+                self.__demo_data_combobox.setItemData(index, file)
             demo_layout = QHBoxLayout()
             demo_layout.addWidget(self.__demo_data_checkbox)
             demo_layout.addWidget(self.__demo_data_combobox)
@@ -102,7 +100,7 @@ class InstallDialog(QDialog):
             self,
         )
         button_box.button(QDialogButtonBox.StandardButton.Ok).setText(
-            self.tr(f"Install {target_version}")
+            self.tr("Install %s") % target_version
         )
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
@@ -154,10 +152,10 @@ class InstallDialog(QDialog):
 
     def parameters(self) -> dict:
         """Return combined parameter values from both groupboxes."""
-        values = {}
-        values.update(self.__standard_groupbox.parameters_values())
-        values.update(self.__app_only_groupbox.parameters_values())
-        return values
+        return {
+            **self.__standard_groupbox.parameters_values(),
+            **self.__app_only_groupbox.parameters_values(),
+        }
 
     def beta_testing(self) -> bool:
         """Return whether beta testing is checked."""
@@ -167,8 +165,8 @@ class InstallDialog(QDialog):
         """Return whether create and grant roles is checked."""
         return self.__roles_groupbox.isChecked()
 
-    def roles_options(self) -> dict:
-        """Return the full roles options dict."""
+    def roles_options(self) -> Mapping:
+        """Return the full roles options mapping."""
         return self.__roles_groupbox.roles_options()
 
     def install_demo_data(self) -> bool:
@@ -1,7 +1,13 @@
 import logging
 from datetime import datetime
 
-from qgis.PyQt.QtCore import QAbstractItemModel, QModelIndex, QSortFilterProxyModel, Qt
+from qgis.PyQt.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+)
 from qgis.PyQt.QtGui import QAction, QKeySequence, QShortcut
 from qgis.PyQt.QtWidgets import (
     QAbstractItemView,
@@ -23,62 +29,73 @@ logging.addLevelName(SQL, "SQL")
 DIALOG_UI = PluginUtils.get_ui_class("logs_widget.ui")
 
 COLUMNS = ["Timestamp", "Level", "Module", "Message"]
+MESSAGE_COLUMN = COLUMNS.index("Message")
+
+# Interval in milliseconds at which buffered log records are added to the view
+FLUSH_INTERVAL = 50
+
+
+class LogModel(QAbstractTableModel):
+    """Log entries model.
 
+    Entries are stored column-wise (one list per column) so that
+    ``data()`` is a plain double list lookup. As a flat table model,
+    ``index()`` and ``parent()`` are handled on the C++ side.
+    """
 
-class LogModel(QAbstractItemModel):
     def __init__(self, parent=None):
-        QAbstractItemModel.__init__(self, parent)
-        self.logs = []
+        QAbstractTableModel.__init__(self, parent)
+        self.columns = [[] for _ in COLUMNS]
 
     def add_log(self, log):
-        self.beginInsertRows(QModelIndex(), len(self.logs), len(self.logs))
-        self.logs.append(log)
+        """Add a log entry, a tuple of values in COLUMNS order."""
+        self.add_logs([log])
+
+    def add_logs(self, logs):
+        """Add several log entries, tuples of values in COLUMNS order."""
+        if not logs:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(logs) - 1)
+        for column, values in zip(self.columns, zip(*logs)):
+            column.extend(values)
         self.endInsertRows()
 
+    def log(self, row: int):
+        """Return the values of a log entry in COLUMNS order."""
+        return [column[row] for column in self.columns]
+
     def headerData(self, section: int, orientation: Qt.Orientation, role: Qt.ItemDataRole = None):
         if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
             return COLUMNS[section]
         return None
 
-    def rowCount(self, parent=None):
-        return len(self.logs)
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns[0])
 
-    def columnCount(self, parent=None):
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
         return len(COLUMNS)
 
     def data(self, index: QModelIndex, role: Qt.ItemDataRole = None):
         if not index.isValid():
             return None
-        if (
-            index.row() < 0
-            or index.row() >= len(self.logs)
-            or index.column() < 0
-            or index.column() >= len(COLUMNS)
-        ):
+        row = index.row()
+        column = index.column()
+        if row < 0 or row >= self.rowCount() or column < 0 or column >= len(COLUMNS):
             return None
 
-        log = self.logs[index.row()]
-        col_name = COLUMNS[index.column()]
-        value = log[col_name]
-
         if role == Qt.ItemDataRole.DisplayRole:
-            return value
+            return self.columns[column][row]
         elif role == Qt.ItemDataRole.ToolTipRole:
             # Show full text in tooltip, especially useful for long messages
-            if col_name == "Message":
-                return value
+            if column == MESSAGE_COLUMN:
+                return self.columns[column][row]
         return None
 
-    def index(self, row: int, column: int, parent=None):
-        if row < 0 or row >= len(self.logs) or column < 0 or column >= len(COLUMNS):
-            return QModelIndex()
-        return self.createIndex(row, column)
-
-    def parent(self, index: QModelIndex):
-        if not index.isValid():
-            return QModelIndex()
-        return QModelIndex()
-
     def flags(self, index: QModelIndex):
         return (
             Qt.ItemFlag.ItemIsEnabled
@@ -88,7 +105,7 @@ class LogModel(QAbstractItemModel):
 
     def clear(self):
         self.beginResetModel()
-        self.logs = []
+        self.columns = [[] for _ in COLUMNS]
         self.endResetModel()
 
 
@@ -143,6 +160,14 @@ class LogsWidget(QWidget, DIALOG_UI):
         )
         self.logs_model = LogModel(self)
 
+        # Log records are buffered and added in batches to avoid a view
+        # update and scroll for every single record during bursts
+        self.__pending_logs = []
+        self.__flush_timer = QTimer(self)
+        self.__flush_timer.setSingleShot(True)
+        self.__flush_timer.setInterval(FLUSH_INTERVAL)
+        self.__flush_timer.timeout.connect(self.__flush_logs)
+
         # Use custom proxy model
         self.proxy_model = LogFilterProxyModel(self)
         self.proxy_model.setSourceModel(self.logs_model)
@@ -189,7 +214,7 @@ class LogsWidget(QWidget, DIALOG_UI):
                 "CRITICAL",
             ]
         )
-        self.logs_level_comboBox.currentTextChanged.connect(self.proxy_model.setLevelFilter)
+        self.logs_level_comboBox.currentTextChanged.connect(self.__logsLevelChanged)
         self.logs_level_comboBox.setCurrentText("INFO")
 
         self.logs_openFile_toolButton.setIcon(
@@ -222,19 +247,27 @@ class LogsWidget(QWidget, DIALOG_UI):
         # Convert timestamp from record.created (epoch time) to readable format
         timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
 
-        log_entry = {
-            "Timestamp": timestamp,
-            "Level": record.levelname,
-            "Module": record.name,
-            "Message": record.getMessage(),
-        }
+        log_entry = (timestamp, record.levelname, record.name, record.getMessage())
+
+        self.__pending_logs.append(log_entry)
+        if not self.__flush_timer.isActive():
+            self.__flush_timer.start()
 
-        self.logs_model.add_log(log_entry)
+    def __flush_logs(self):
+        pending_logs = self.__pending_logs
+        self.__pending_logs = []
+        self.logs_model.add_logs(pending_logs)
 
         # Automatically scroll to the bottom of the logs
         scroll_bar = self.logs_treeView.verticalScrollBar()
         scroll_bar.setValue(scroll_bar.maximum())
 
+    def __logsLevelChanged(self, level):
+        self.proxy_model.setLevelFilter(level)
+        # Records below the selected level are dropped by the logging framework
+        # before reaching the bridge, so they never enter the model
+        self.loggingBridge.setLevel(logging.getLevelName(level))
+
     def __logsOpenFileClicked(self):
         PluginUtils.open_log_file()
 
@@ -242,6 +275,7 @@ class LogsWidget(QWidget, DIALOG_UI):
         PluginUtils.open_logs_folder()
 
     def __logsClearClicked(self):
+        self.__pending_logs = []
         self.logs_model.clear()
 
     def __showContextMenu(self, position):
@@ -343,7 +377,7 @@ class LogsWidget(QWidget, DIALOG_UI):
             # Map proxy index to source model index
             source_index = self.proxy_model.mapToSource(proxy_index)
             row = source_index.row()
-            log_entry = self.logs_model.logs[row]
+            log_entry = self.logs_model.log(row)
 
             # Escape fields that might contain commas or quotes
             def escape_csv(value):
@@ -352,14 +386,7 @@ class LogsWidget(QWidget, DIALOG_UI):
                     return '"' + value.replace('"', '""') + '"'
                 return value
 
-            csv_line = ",".join(
-                [
-                    escape_csv(log_entry["Timestamp"]),
-                    escape_csv(log_entry["Level"]),
-                    escape_csv(log_entry["Module"]),
-                    escape_csv(log_entry["Message"]),
-                ]
-            )
+            csv_line = ",".join(escape_csv(value) for value in log_entry)
             csv_lines.append(csv_line)
 
         # Copy to clipboard
@@ -376,7 +403,7 @@ class LogsWidget(QWidget, DIALOG_UI):
 
         source_index = self.proxy_model.mapToSource(selected_indexes[0])
         row = source_index.row()
-        log_entry = self.logs_model.logs[row]
+        message = self.logs_model.columns[MESSAGE_COLUMN][row]
 
         clipboard = QApplication.clipboard()
-        clipboard.setText(str(log_entry["Message"]))
+        clipboard.setText(str(message))
@@ -229,10 +229,11 @@ class MainDialog(QDialog, DIALOG_UI):
             self,
             self.tr("Cleanup Cache"),
             self.tr(
-                f"This will delete all cached data from:\n{paths_display}\n\n"
+                "This will delete all cached data from:\n%s\n\n"
                 "Downloaded module packages and API cache will need to be re-fetched.\n\n"
                 "Are you sure you want to continue?"
-            ),
+            )
+            % paths_display,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
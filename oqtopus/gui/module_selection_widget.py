@@ -39,7 +39,8 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
             logger.error(f"Error loading modules config from {modules_config_path}: {e}")
             MessageBar.pushErrorToBar(
                 self,
-                self.tr(f"Can't load modules configuration from '{modules_config_path}': {e}"),
+                self.tr("Can't load modules configuration from '%s': %s")
+                % (modules_config_path, e),
             )
             self.__modules_config = None
 
@@ -78,6 +79,7 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
         self.module_module_comboBox.clear()
         self.module_module_comboBox.addItem(self.tr("Please select a module"), None)
         show_experimental = Settings().show_experimental_modules.value()
+        modules = []
         if self.__modules_config is not None:
             for config_module in self.__modules_config.modules:
                 if config_module.experimental and not show_experimental:
@@ -98,9 +100,15 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
                 module.signal_developmentVersionsLoaded.connect(
                     self.__loadDevelopmentVersionsFinished
                 )
+                modules.append(module)
         self.module_module_comboBox.blockSignals(False)
         self.module_module_comboBox.setCurrentIndex(0)
 
+        # Development versions are loaded on every module selection, warm up
+        # the cache of all modules at once
+        if Settings().auto_load_development_versions.value():
+            Module.start_prefetch_development_versions(modules)
+
     def close(self):
         if self.__packagePrepareTask.isRunning():
             # Disconnect signals first to prevent crashes when emitting to destroyed widgets
@@ -381,7 +389,7 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
             self.module_progressBar.setValue(0)
             if bytes_downloaded > 0:
                 mb_downloaded = bytes_downloaded / (1024 * 1024)
-                loading_text = self.tr(f"Downloading package... {mb_downloaded:.1f} MB")
+                loading_text = self.tr("Downloading package... %.1f MB") % mb_downloaded
             else:
                 loading_text = self.tr("Downloading package...")
         else:
@@ -389,7 +397,7 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
             self.module_progressBar.setMaximum(100)
             self.module_progressBar.setValue(int(progress))
             mb_downloaded = bytes_downloaded / (1024 * 1024)
-            loading_text = self.tr(f"Downloading... {mb_downloaded:.1f} MB ({progress:.0f}%)")
+            loading_text = self.tr("Downloading... %.1f MB (%.0f%%)") % (mb_downloaded, progress)
 
         self.module_information_label.setText(loading_text)
 
@@ -410,9 +418,8 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
         if self.__current_module_package.html_url is None:
             MessageBar.pushWarningToBar(
                 self,
-                self.tr(
-                    f"Changelog not available for version '{self.__current_module_package.display_name()}'."
-                ),
+                self.tr("Changelog not available for version '%s'.")
+                % self.__current_module_package.display_name(),
             )
             return
 
@@ -439,7 +446,7 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
                 )
                 return
 
-            error_text = self.tr(f"Can't load module versions: {error}")
+            error_text = self.tr("Can't load module versions: %s") % error
             MessageBar.pushErrorToBar(self, error_text)
             self.module_information_label.setText(error_text)
             QtUtils.setForegroundColor(self.module_information_label, PluginUtils.COLOR_WARNING)
@@ -535,7 +542,7 @@ class ModuleSelectionWidget(QWidget, DIALOG_UI):
                 )
                 return
 
-            error_text = self.tr(f"Can't load module versions: {error}")
+            error_text = self.tr("Can't load module versions: %s") % error
             MessageBar.pushErrorToBar(self, error_text)
             self.module_information_label.setText(error_text)
             QtUtils.setForegroundColor(self.module_information_label, PluginUtils.COLOR_WARNING)
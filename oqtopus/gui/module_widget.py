@@ -1,26 +1,56 @@
+import io
 import os
-from pathlib import Path
+import time
 
 import psycopg
-import yaml
-from qgis.PyQt.QtCore import QSize, QTimer, pyqtSignal
-from qgis.PyQt.QtWidgets import QMessageBox, QSizePolicy, QTextBrowser, QWidget
-
+from qgis.PyQt.QtCore import QEvent, QSize, QTimer, pyqtSignal
+from qgis.PyQt.QtWidgets import (
+    QGridLayout,
+    QMessageBox,
+    QSizePolicy,
+    QTextBrowser,
+    QWidget,
+)
+
+from ..core.migration_probe_task import MigrationProbeTask, probe_migrations
 from ..core.module import Module
 from ..core.module_operation_task import ModuleOperationTask
+from ..core.pum_config_load_task import PumConfigLoadTask
 from ..core.settings import Settings
 from ..libs.pgserviceparser.gui.message_bar import MessageBar
-from ..libs.pum.pum_config import PumConfig
 from ..libs.pum.schema_migrations import SchemaMigrations
 from ..utils.plugin_utils import PluginUtils, logger
 from ..utils.qt_utils import QtUtils
 from .install_dialog import InstallDialog
-from .recreate_app_dialog import RecreateAppDialog
 from .roles_manage_dialog import RolesManageDialog
 from .upgrade_dialog import UpgradeDialog
 
 DIALOG_UI = PluginUtils.get_ui_class("module_widget.ui")
 
+# Seconds the migration state read from the database is re-used, the cache is
+# dropped anyway when the module package, the database or the module state changes
+MIGRATION_STATE_CACHE_DURATION = 60
+
+# Style sheets of the installation info labels
+INFO_LABEL_STYLE_NORMAL = (
+    "QTextBrowser { "
+    "  background-color: #f5f5f5; "
+    "  border: 1px solid #d0d0d0; "
+    "  border-radius: 4px; "
+    "  padding: 6px; "
+    "  color: #333333; "
+    "}"
+)
+INFO_LABEL_STYLE_WARNING = (
+    "QTextBrowser { "
+    "  background-color: #fff3cd; "
+    "  border: 1px solid #e0c76a; "
+    "  border-radius: 4px; "
+    "  padding: 6px; "
+    "  color: #664d03; "
+    "}"
+)
+
 
 class _AutoHeightTextBrowser(QTextBrowser):
     """A QTextBrowser that sizes itself to fit its content height.
@@ -33,6 +63,14 @@ class _AutoHeightTextBrowser(QTextBrowser):
         super().__init__(parent)
         self.document().documentLayout().documentSizeChanged.connect(self._on_content_changed)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self._html = None
+
+    def setHtml(self, html: str):
+        # Re-selecting the same module renders the same text, skip parsing it again
+        if html == self._html:
+            return
+        self._html = html
+        super().setHtml(html)
 
     def _content_height(self) -> int:
         margins = self.contentsMargins()
@@ -57,15 +95,27 @@ class ModuleWidget(QWidget, DIALOG_UI):
         QWidget.__init__(self, parent)
         self.setupUi(self)
 
+        self.__texts = {}
+        self.__retranslate()
+
         self.moduleInfo_stackedWidget.setCurrentWidget(self.moduleInfo_stackedWidget_pageInstall)
 
-        # Replace installation info QLabels with QTextBrowser for scrollable content
-        for label_name in (
-            "moduleInfo_installation_label_install",
-            "moduleInfo_installation_label_upgrade",
-            "moduleInfo_installation_label_maintain",
-        ):
-            self.__replace_label_with_text_browser(label_name)
+        # Replace installation info QLabels with QTextBrowser for scrollable content,
+        # the old labels are deleted once all layouts have been updated
+        self.setUpdatesEnabled(False)
+        try:
+            old_labels = [
+                self.__replace_label_with_text_browser(label_name)
+                for label_name in (
+                    "moduleInfo_installation_label_install",
+                    "moduleInfo_installation_label_upgrade",
+                    "moduleInfo_installation_label_maintain",
+                )
+            ]
+        finally:
+            self.setUpdatesEnabled(True)
+        for old_label in old_labels:
+            old_label.deleteLater()
 
         self.moduleInfo_install_pushButton.clicked.connect(self.__installModuleClicked)
         self.moduleInfo_upgrade_pushButton.clicked.connect(self.__upgradeModuleClicked)
@@ -79,13 +129,49 @@ class ModuleWidget(QWidget, DIALOG_UI):
         self.__current_module_package = None
         self.__database_connection = None
         self.__pum_config = None
+        self.__pum_config_file = None
         self.__data_model_dir = None
+        self.__standard_params = []
+        self.__app_only_params = []
+
+        # Migrations of the current PUM config and (key, timestamp, summary, baseline) of the last query
+        self.__schema_migrations = None
+        self.__migration_state_cache = None
+
+        # Migration table queried in the background for the operation click handlers
+        self.__migration_probe_task = MigrationProbeTask(self)
+        self.__migration_probe_task.signalFinished.connect(self.__onMigrationProbeFinished)
+        self.__migration_probe_key = None
+        self.__migration_probe_callback = None
+
+        # PUM config is loaded in the background, a package selected while
+        # loading is loaded once the running load finishes
+        self.__pum_config_load_task = PumConfigLoadTask(self)
+        self.__pum_config_load_task.signalFinished.connect(self.__onPumConfigLoaded)
+        self.__pum_config_load_pending = False
+        self.__pum_config_loading = False
+
+        # Main dialog group boxes disabled during operations, resolved on first use
+        self.__main_dialog_group_boxes = None
+
+        # Install dialog kept for re-opening with the same package and version
+        self.__install_dialog = None
+        self.__install_dialog_key = None
 
         # Background operation task
         self.__operation_task = ModuleOperationTask(self)
         self.__operation_task.signalProgress.connect(self.__onOperationProgress)
         self.__operation_task.signalFinished.connect(self.__onOperationFinished)
 
+        # State changes requested while an operation runs, applied once it has stopped
+        self.__pending_after_operation = []
+
+        # Coalesces module info updates requested within the same event loop iteration
+        self.__update_module_info_timer = QTimer(self)
+        self.__update_module_info_timer.setSingleShot(True)
+        self.__update_module_info_timer.setInterval(0)
+        self.__update_module_info_timer.timeout.connect(self.__updateModuleInfo)
+
         # Timeout timer for detecting hung operations
         self.__cancel_timeout_timer = QTimer(self)
         self.__cancel_timeout_timer.setSingleShot(True)
@@ -95,7 +181,53 @@ class ModuleWidget(QWidget, DIALOG_UI):
         self.moduleInfo_cancel_button.setVisible(False)
         self.moduleInfo_progressbar.setVisible(False)
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.__retranslate()
+        super().changeEvent(event)
+
+    def __retranslate(self):
+        """Translate the static texts of the click handlers once, not on every click."""
+        self.__texts = {
+            "cancel": self.tr("Cancel"),
+            "canceling": self.tr("Canceling..."),
+            "select_module_package": self.tr("Please select a module package first."),
+            "select_database_service": self.tr("Please select a database service first."),
+            "connect_database": self.tr("Please connect to a database first."),
+            "no_valid_module": self.tr("No valid module available."),
+            "config_not_loaded": self.tr("Module configuration not loaded."),
+            "module_id_mismatch": self.tr(
+                "Module ID mismatch: The selected module is '%s' but the PUM configuration specifies '%s'."
+            ),
+            "confirm_upgrade": self.tr("Confirm Upgrade"),
+            "beta_testing_upgrade_warning": self.tr(
+                "The installed module is in BETA TESTING mode.\n\n"
+                "Are you sure you want to upgrade? \n"
+                "This is not a recommended action: \n"
+                "if the installed version has missing or different changelogs, \n"
+                "the upgrade may fail or cause further issues."
+            ),
+            "confirm_uninstall": self.tr("Confirm Uninstall"),
+            "uninstall_warning": self.tr(
+                "Are you sure you want to uninstall module '%s'?\n\n"
+                "This action will remove all module data from the database and cannot be undone."
+            ),
+            "drop_app": self.tr("Drop app"),
+            "drop_app_warning": self.tr(
+                "Are you sure you want to drop the application?\n\n"
+                "This will execute drop app handlers defined in the module configuration."
+            ),
+        }
+
     def setModulePackage(self, module_package: Module):
+        if self.__operation_task.isRunning():
+            self.__cancelOperationThen(
+                "module package change", lambda: self.__setModulePackage(module_package)
+            )
+            return
+        self.__setModulePackage(module_package)
+
+    def __setModulePackage(self, module_package: Module):
         # Clean up old hook imports before loading new version
         if self.__pum_config is not None:
             try:
@@ -105,19 +237,24 @@ class ModuleWidget(QWidget, DIALOG_UI):
                 pass
 
         self.__current_module_package = module_package
-        self.__packagePrepareGetPUMConfig()
-        self.__updateModuleInfo()
+        self.__pum_config = None
+        self.__schema_migrations = None
+        self.__migration_state_cache = None
+        self.__discardInstallDialog()
+        if self.__packagePrepareGetPUMConfig():
+            # Module info is updated once the PUM config is loaded
+            self.__show_no_module_selected_page()
+            return
+        self.__scheduleUpdateModuleInfo()
 
     def clearModulePackage(self):
         """Clear module package state and disable the stacked widget."""
-        # Cancel any running operations before clearing
         if self.__operation_task.isRunning():
-            logger.warning("Canceling running operation due to module package change")
-            self.__operation_task.cancel()
-            # Don't wait - just reset UI immediately to avoid freezing
-            # The finished signal will be emitted when the thread stops
+            self.__cancelOperationThen("module package change", self.__clearModulePackage)
+            return
+        self.__clearModulePackage()
 
-        # Reset UI state immediately
+    def __clearModulePackage(self):
         self.__resetOperationUI()
 
         # Clean up any imported modules from hooks to prevent conflicts
@@ -130,8 +267,12 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
         self.__current_module_package = None
         self.__pum_config = None
+        self.__schema_migrations = None
+        self.__migration_state_cache = None
+        self.__pum_config_file = None
         self.__data_model_dir = None
-        self.__updateModuleInfo()
+        self.__discardInstallDialog()
+        self.__scheduleUpdateModuleInfo()
 
     def close(self):
         """Clean up resources when the widget is closed."""
@@ -140,6 +281,12 @@ class ModuleWidget(QWidget, DIALOG_UI):
             logger.warning("Canceling running operation due to widget close")
             self.__operation_task.cancel()
 
+        # Let running background reads finish before the widget goes away
+        self.__pum_config_load_pending = False
+        self.__pum_config_loading = False
+        self.__pum_config_load_task.wait()
+        self.__migration_probe_task.wait()
+
         # Clean up hook imports to release sys.path and sys.modules entries
         if self.__pum_config is not None:
             try:
@@ -151,23 +298,34 @@ class ModuleWidget(QWidget, DIALOG_UI):
         """Return True if an operation is currently running."""
         return self.__operation_task.isRunning()
 
+    def isUpdatePending(self) -> bool:
+        """Return True while the PUM config, the module info or the module state is being read."""
+        return (
+            self.__pum_config_loading
+            or self.__update_module_info_timer.isActive()
+            or self.__migration_probe_callback is not None
+        )
+
     def setDatabaseConnection(self, connection: psycopg.Connection, update_info: bool = True):
-        # Cancel any running operations before changing database
         if self.__operation_task.isRunning():
-            logger.warning("Canceling running operation due to database connection change")
-            self.__operation_task.cancel()
-            # Don't wait - just reset UI immediately to avoid freezing
+            self.__cancelOperationThen(
+                "database connection change",
+                lambda: self.__setDatabaseConnection(connection, update_info),
+            )
+            return
+        self.__setDatabaseConnection(connection, update_info)
 
-        # Reset UI state immediately
+    def __setDatabaseConnection(self, connection: psycopg.Connection, update_info: bool):
         self.__resetOperationUI()
 
         self.__database_connection = connection
+        self.__migration_state_cache = None
         if update_info:
-            self.__updateModuleInfo()
+            self.__scheduleUpdateModuleInfo()
 
     def updateModuleInfo(self):
         """Public wrapper to refresh the module info display."""
-        self.__updateModuleInfo()
+        self.__scheduleUpdateModuleInfo()
 
     def __resetOperationUI(self):
         """Reset UI elements related to operations."""
@@ -179,130 +337,199 @@ class ModuleWidget(QWidget, DIALOG_UI):
         Args:
             in_progress: True to disable UI (operation starting), False to enable (operation finished)
         """
-        # Main operation buttons - disable during operation
-        self.moduleInfo_install_pushButton.setEnabled(not in_progress)
-        self.moduleInfo_upgrade_pushButton.setEnabled(not in_progress)
-        self.moduleInfo_check_roles_pushButton.setEnabled(not in_progress)
-        self.uninstall_button.setEnabled(not in_progress)
-
-        # Stacked widget contains all the form controls
-        self.moduleInfo_stackedWidget.setEnabled(not in_progress)
-
-        # Cancel button and progress bar - only visible during operation
-        self.moduleInfo_cancel_button.setVisible(in_progress)
-        self.moduleInfo_cancel_button.setEnabled(in_progress)
-        if not in_progress:
-            self.moduleInfo_cancel_button.setText(self.tr("Cancel"))
-
-        self.moduleInfo_progressbar.setVisible(in_progress)
-        if not in_progress:
-            self.moduleInfo_progressbar.setValue(0)
-
-        # Parent controls (module selection, database connection)
         # Use window() to get the top-level MainDialog, since self.parent()
         # returns the immediate tab widget, not the dialog itself.
         main_dialog = self.window()
-        if main_dialog is not None:
-            if hasattr(main_dialog, "moduleSelection_groupBox"):
-                main_dialog.moduleSelection_groupBox.setEnabled(not in_progress)
-            if hasattr(main_dialog, "db_groupBox"):
-                main_dialog.db_groupBox.setEnabled(not in_progress)
+
+        # Repaint the dialog once after all state changes
+        main_dialog.setUpdatesEnabled(False)
+        try:
+            # Main operation buttons - disable during operation
+            self.moduleInfo_install_pushButton.setEnabled(not in_progress)
+            self.moduleInfo_upgrade_pushButton.setEnabled(not in_progress)
+            self.moduleInfo_check_roles_pushButton.setEnabled(not in_progress)
+            self.uninstall_button.setEnabled(not in_progress)
+
+            # Stacked widget contains all the form controls
+            self.moduleInfo_stackedWidget.setEnabled(not in_progress)
+
+            # Cancel button and progress bar - only visible during operation
+            self.moduleInfo_cancel_button.setVisible(in_progress)
+            self.moduleInfo_cancel_button.setEnabled(in_progress)
+            if not in_progress:
+                self.moduleInfo_cancel_button.setText(self.__texts["cancel"])
+
+            self.moduleInfo_progressbar.setVisible(in_progress)
+            if not in_progress:
+                self.moduleInfo_progressbar.setValue(0)
+
+            # Parent controls (module selection, database connection)
+            if self.__main_dialog_group_boxes is None:
+                self.__main_dialog_group_boxes = [
+                    group_box
+                    for group_box in (
+                        getattr(main_dialog, "moduleSelection_groupBox", None),
+                        getattr(main_dialog, "db_groupBox", None),
+                    )
+                    if group_box is not None
+                ]
+            for group_box in self.__main_dialog_group_boxes:
+                group_box.setEnabled(not in_progress)
+        finally:
+            main_dialog.setUpdatesEnabled(True)
 
     def __packagePrepareGetPUMConfig(self):
+        """Start loading the PUM config of the current module package.
+
+        Returns True if loading was started, the config is then set in __onPumConfigLoaded.
+        """
+        self.__pum_config_file = None
         package_dir = self.__current_module_package.source_package_dir
 
         if package_dir is None:
             MessageBar.pushErrorToBar(
                 self,
-                self.tr(
-                    f"The selected file '{self.__current_module_package.source_package_zip}' doesn't contain a valid package directory."
-                ),
+                self.tr("The selected file '%s' doesn't contain a valid package directory.")
+                % self.__current_module_package.source_package_zip,
             )
-            return
+            return False
 
+        # A missing file is reported by the load task, no need to check for it here
         self.__data_model_dir = os.path.join(package_dir, "datamodel")
         pumConfigFilename = os.path.join(self.__data_model_dir, ".pum.yaml")
-        if not os.path.exists(pumConfigFilename):
+        self.__pum_config_file = pumConfigFilename
+        self.__pum_config_loading = True
+        if self.__pum_config_load_task.isRunning():
+            self.__pum_config_load_pending = True
+            return True
+
+        self.__pum_config_load_task.start_load(self.__current_module_package, pumConfigFilename)
+        return True
+
+    def __onPumConfigLoaded(self, module_package, pum_config, exception):
+        self.__pum_config_loading = False
+        if module_package is not self.__current_module_package or self.__pum_config_load_pending:
+            # The module package changed while loading, drop the outdated config
+            if pum_config is not None:
+                try:
+                    pum_config.cleanup_hook_imports()
+                except Exception:
+                    pass
+
+            if self.__pum_config_load_pending and self.__pum_config_file is not None:
+                self.__pum_config_load_pending = False
+                self.__pum_config_loading = True
+                self.__pum_config_load_task.start_load(
+                    self.__current_module_package, self.__pum_config_file
+                )
+            self.__pum_config_load_pending = False
+            return
+
+        pumConfigFilename = self.__pum_config_file
+        if isinstance(exception, FileNotFoundError):
             MessageBar.pushErrorToBar(
                 self,
-                self.tr(
-                    f"The selected file '{self.__current_module_package.source_package_zip}' doesn't contain a valid .pum.yaml file."
-                ),
+                self.tr("The selected file '%s' doesn't contain a valid .pum.yaml file.")
+                % self.__current_module_package.source_package_zip,
             )
+            self.__scheduleUpdateModuleInfo()
             return
 
-        try:
-            with open(pumConfigFilename) as file:
-                # since pum 1.3, the module id is mandatory in the pum config
-                config_data = yaml.safe_load(file)
-                if "pum" not in config_data:
-                    config_data["pum"] = {}
-                if "module" not in config_data["pum"]:
-                    config_data["pum"]["module"] = self.__current_module_package.module.id
-                base_path = Path(pumConfigFilename).parent
-            self.__pum_config = PumConfig(
-                base_path=base_path, install_dependencies=True, **config_data
-            )
-        except Exception as exception:
+        if exception is not None:
             MessageBar.pushErrorToBar(
-                self, self.tr(f"Can't load PUM config from '{pumConfigFilename}':"), exception
+                self, self.tr("Can't load PUM config from '%s':") % pumConfigFilename, exception
             )
+            self.__scheduleUpdateModuleInfo()
             return
 
+        self.__pum_config = pum_config
+        self.__schema_migrations = SchemaMigrations(pum_config)
+        self.__migration_state_cache = None
         logger.info(f"PUM config loaded from '{pumConfigFilename}'")
 
+        # Partition the parameters once, they are used by all operation dialogs
+        self.__standard_params = []
+        self.__app_only_params = []
         try:
-            all_params = self.__pum_config.parameters()
-            standard_params = [p for p in all_params if not p.app_only]
-            app_only_params = [p for p in all_params if p.app_only]
-            self.__standard_params = standard_params
-            self.__app_only_params = app_only_params
+            for parameter in self.__pum_config.parameters():
+                if parameter.app_only:
+                    self.__app_only_params.append(parameter)
+                else:
+                    self.__standard_params.append(parameter)
         except Exception as exception:
             MessageBar.pushErrorToBar(
                 self,
-                self.tr(f"Can't load parameters from PUM config '{pumConfigFilename}':"),
+                self.tr("Can't load parameters from PUM config '%s':") % pumConfigFilename,
                 exception,
             )
-            return
 
-    def __installModuleClicked(self):
+        self.__scheduleUpdateModuleInfo()
 
-        if self.__current_module_package is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a module package first."))
-            return
+    def __checkPreconditions(
+        self,
+        database_text="select_database_service",
+        config_text="no_valid_module",
+        check_module_id=False,
+    ) -> bool:
+        """Check that a package, a database and a PUM config are available for an operation.
+
+        Pushes an error to the message bar and returns False if one is missing.
+        """
+        module_package = self.__current_module_package
+        pum_config = self.__pum_config
+
+        if module_package is None:
+            MessageBar.pushErrorToBar(self, self.__texts["select_module_package"])
+            return False
 
         if self.__database_connection is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a database service first."))
-            return
+            MessageBar.pushErrorToBar(self, self.__texts[database_text])
+            return False
+
+        if pum_config is None:
+            MessageBar.pushErrorToBar(self, self.__texts[config_text])
+            return False
+
+        if check_module_id:
+            # Check that the module ID in the PUM config matches the selected module
+            pum_module_id = pum_config.config.pum.module
+            selected_module_id = module_package.module.id
+            if pum_module_id != selected_module_id:
+                MessageBar.pushErrorToBar(
+                    self,
+                    self.__texts["module_id_mismatch"] % (selected_module_id, pum_module_id),
+                )
+                return False
 
-        if self.__pum_config is None:
-            MessageBar.pushErrorToBar(self, self.tr("No valid module available."))
-            return
+        return True
 
-        # Check that the module ID in the PUM config matches the selected module
-        pum_module_id = self.__pum_config.config.pum.module
-        selected_module_id = self.__current_module_package.module.id
-        if pum_module_id != selected_module_id:
-            MessageBar.pushErrorToBar(
-                self,
-                self.tr(
-                    f"Module ID mismatch: The selected module is '{selected_module_id}' but the PUM configuration specifies '{pum_module_id}'."
-                ),
-            )
+    def __installModuleClicked(self):
+        if not self.__checkPreconditions(check_module_id=True):
             return
 
+        pum_config = self.__pum_config
+        module_package = self.__current_module_package
+
         try:
-            target_version = self.__pum_config.last_version()
-            demo_data = self.__pum_config.demo_data()
+            target_version = pum_config.last_version()
+            demo_data = pum_config.demo_data()
+
+            # Re-use the dialog (and its parameter widgets) when re-opened
+            # for the same package and version
+            dialog_key = (module_package, target_version)
+            if self.__install_dialog is None or self.__install_dialog_key != dialog_key:
+                self.__discardInstallDialog()
+                self.__install_dialog = InstallDialog(
+                    module_package,
+                    self.__standard_params,
+                    self.__app_only_params,
+                    target_version,
+                    demo_data if demo_data else None,
+                    self,
+                )
+                self.__install_dialog_key = dialog_key
+            dialog = self.__install_dialog
 
-            dialog = InstallDialog(
-                self.__current_module_package,
-                self.__standard_params,
-                self.__app_only_params,
-                target_version,
-                demo_data if demo_data else None,
-                self,
-            )
             if dialog.exec() != InstallDialog.DialogCode.Accepted:
                 return
 
@@ -323,45 +550,35 @@ class ModuleWidget(QWidget, DIALOG_UI):
             MessageBar.pushErrorToBar(self, self.tr("Can't install the module:"), exception)
             return
 
+    def __discardInstallDialog(self):
+        if self.__install_dialog is not None:
+            self.__install_dialog.deleteLater()
+        self.__install_dialog = None
+        self.__install_dialog_key = None
+
     def __upgradeModuleClicked(self):
-        if self.__current_module_package is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a module package first."))
+        if not self.__checkPreconditions(check_module_id=True):
             return
 
-        if self.__database_connection is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a database service first."))
-            return
+        self.__probeMigrationState(self.__upgradeModule)
 
-        if self.__pum_config is None:
-            MessageBar.pushErrorToBar(self, self.tr("No valid module available."))
-            return
-
-        # Check that the module ID in the PUM config matches the selected module
-        pum_module_id = self.__pum_config.config.pum.module
-        selected_module_id = self.__current_module_package.module.id
-        if pum_module_id != selected_module_id:
-            MessageBar.pushErrorToBar(
-                self,
-                self.tr(
-                    f"Module ID mismatch: The selected module is '{selected_module_id}' but the PUM configuration specifies '{pum_module_id}'."
-                ),
-            )
-            return
+    def __upgradeModule(self, migration_summary, baseline_version):
+        pum_config = self.__pum_config
+        pum_module_id = pum_config.config.pum.module
 
         # Check that the module ID matches the installed module in the database
-        sm = SchemaMigrations(self.__pum_config)
         installed_beta_testing = False
-        if sm.exists(self.__database_connection):
-            migration_details = sm.migration_details(self.__database_connection)
-            installed_module_id = migration_details.get("module")
-            installed_beta_testing = migration_details.get("beta_testing", False)
+        if migration_summary is not None:
+            installed_module_id = migration_summary.get("module")
+            installed_beta_testing = migration_summary.get("beta_testing", False)
 
             if installed_module_id and installed_module_id != pum_module_id:
                 MessageBar.pushErrorToBar(
                     self,
                     self.tr(
-                        f"Module ID mismatch: The database contains module '{installed_module_id}' but you are trying to upgrade with '{pum_module_id}'."
-                    ),
+                        "Module ID mismatch: The database contains module '%s' but you are trying to upgrade with '%s'."
+                    )
+                    % (installed_module_id, pum_module_id),
                 )
                 return
 
@@ -369,14 +586,8 @@ class ModuleWidget(QWidget, DIALOG_UI):
             if installed_beta_testing:
                 reply = QMessageBox.question(
                     self,
-                    self.tr("Confirm Upgrade"),
-                    self.tr(
-                        "The installed module is in BETA TESTING mode.\n\n"
-                        "Are you sure you want to upgrade? \n"
-                        "This is not a recommended action: \n"
-                        "if the installed version has missing or different changelogs, \n"
-                        "the upgrade may fail or cause further issues."
-                    ),
+                    self.__texts["confirm_upgrade"],
+                    self.__texts["beta_testing_upgrade_warning"],
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                     QMessageBox.StandardButton.No,
                 )
@@ -384,21 +595,17 @@ class ModuleWidget(QWidget, DIALOG_UI):
                     return
 
         try:
-            all_params = self.__pum_config.parameters()
-            standard_params = [p for p in all_params if not p.app_only]
-            app_only_params = [p for p in all_params if p.app_only]
-            target_version = self.__pum_config.last_version()
+            target_version = pum_config.last_version()
 
             # Get installed parameter values to preset in the dialog
             installed_parameters = None
-            migration_summary = sm.migration_summary(self.__database_connection)
-            if migration_summary.get("parameters"):
+            if migration_summary and migration_summary.get("parameters"):
                 installed_parameters = migration_summary["parameters"]
 
             dialog = UpgradeDialog(
                 self.__current_module_package,
-                standard_params,
-                app_only_params,
+                self.__standard_params,
+                self.__app_only_params,
                 target_version,
                 installed_parameters,
                 self,
@@ -423,16 +630,7 @@ class ModuleWidget(QWidget, DIALOG_UI):
             MessageBar.pushErrorToBar(self, self.tr("Can't upgrade the module:"), exception)
 
     def __uninstallModuleClicked(self):
-        if self.__current_module_package is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a module package first."))
-            return
-
-        if self.__database_connection is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a database service first."))
-            return
-
-        if self.__pum_config is None:
-            MessageBar.pushErrorToBar(self, self.tr("No valid module available."))
+        if not self.__checkPreconditions():
             return
 
         # Check if uninstall hooks are defined
@@ -445,12 +643,16 @@ class ModuleWidget(QWidget, DIALOG_UI):
             )
             return
 
+        self.__probeMigrationState(self.__uninstallModule)
+
+    def __uninstallModule(self, migration_summary, installed_version):
         # Check if the installed version matches the selected version
-        sm = SchemaMigrations(self.__pum_config)
         version_warning = ""
-        if not sm.exists(self.__database_connection):
-            raise Exception("Module is not installed in the database. This should not happen.")
-        installed_version = sm.baseline(self.__database_connection)
+        if migration_summary is None:
+            MessageBar.pushErrorToBar(
+                self, self.tr("Module is not installed in the database. This should not happen.")
+            )
+            return
         selected_version = self.__pum_config.last_version()
         if installed_version != selected_version:
             version_warning = (
@@ -463,12 +665,9 @@ class ModuleWidget(QWidget, DIALOG_UI):
         # Confirm uninstall with user
         reply = QMessageBox.question(
             self,
-            self.tr("Confirm Uninstall"),
-            self.tr(
-                f"Are you sure you want to uninstall module '{self.__current_module_package.module.name}'?\n\n"
-                f"This action will remove all module data from the database and cannot be undone."
-                f"{version_warning}"
-            ),
+            self.__texts["confirm_uninstall"],
+            self.__texts["uninstall_warning"] % self.__current_module_package.module.name
+            + version_warning,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
@@ -488,16 +687,9 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
     def __checkRolesClicked(self):
         """Check the database roles against the module configuration."""
-        if self.__current_module_package is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a module package first."))
-            return
-
-        if self.__database_connection is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please connect to a database first."))
-            return
-
-        if self.__pum_config is None:
-            MessageBar.pushErrorToBar(self, self.tr("Module configuration not loaded."))
+        if not self.__checkPreconditions(
+            database_text="connect_database", config_text="config_not_loaded"
+        ):
             return
 
         try:
@@ -525,25 +717,15 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
     def __dropAppClicked(self):
         """Execute drop app handlers for the current module."""
-        if self.__current_module_package is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a module package first."))
-            return
-
-        if self.__database_connection is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please connect to a database first."))
-            return
-
-        if self.__pum_config is None:
-            MessageBar.pushErrorToBar(self, self.tr("Module configuration not loaded."))
+        if not self.__checkPreconditions(
+            database_text="connect_database", config_text="config_not_loaded"
+        ):
             return
 
         reply = QMessageBox.question(
             self,
-            self.tr("Drop app"),
-            self.tr(
-                "Are you sure you want to drop the application?\n\n"
-                "This will execute drop app handlers defined in the module configuration."
-            ),
+            self.__texts["drop_app"],
+            self.__texts["drop_app_warning"],
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
@@ -563,30 +745,20 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
     def __recreateAppClicked(self):
         """Execute recreate app (drop + create) handlers for the current module."""
-        if self.__current_module_package is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please select a module package first."))
-            return
-
-        if self.__database_connection is None:
-            MessageBar.pushErrorToBar(self, self.tr("Please connect to a database first."))
-            return
-
-        if self.__pum_config is None:
-            MessageBar.pushErrorToBar(self, self.tr("Module configuration not loaded."))
-            return
-
-        try:
-            all_params = self.__pum_config.parameters()
-            standard_params = [p for p in all_params if not p.app_only]
-            app_only_params = [p for p in all_params if p.app_only]
-        except Exception as exception:
-            MessageBar.pushErrorToBar(self, self.tr("Can't load parameters:"), exception)
+        if not self.__checkPreconditions(
+            database_text="connect_database", config_text="config_not_loaded"
+        ):
             return
 
         # Get installed parameter values to preset in the dialog
         installed_parameters = self.__get_installed_parameters() or None
 
-        dialog = RecreateAppDialog(standard_params, app_only_params, installed_parameters, self)
+        # Only imported when recreating the app, most sessions never do
+        from .recreate_app_dialog import RecreateAppDialog
+
+        dialog = RecreateAppDialog(
+            self.__standard_params, self.__app_only_params, installed_parameters, self
+        )
         if dialog.exec() != RecreateAppDialog.DialogCode.Accepted:
             return
 
@@ -602,12 +774,87 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
     def __get_installed_parameters(self) -> dict:
         """Get parameter values from the installed module in the database."""
-        sm = SchemaMigrations(self.__pum_config)
-        if sm.exists(self.__database_connection):
-            migration_summary = sm.migration_summary(self.__database_connection)
+        migration_summary, _ = self.__migrationState()
+        if migration_summary is not None:
             return migration_summary.get("parameters") or {}
         return {}
 
+    def __migrationStateKey(self):
+        """Return what the migration state read from the database depends on."""
+        return (self.__schema_migrations, self.__database_connection)
+
+    def __cacheMigrationState(self, key, migration_summary, baseline):
+        self.__migration_state_cache = (key, time.monotonic(), migration_summary, baseline)
+
+    def __cachedMigrationState(self):
+        """Return the cached (migration_summary, baseline) if still valid, None otherwise."""
+        if self.__migration_state_cache is None:
+            return None
+        key, timestamp, migration_summary, baseline = self.__migration_state_cache
+        if key != self.__migrationStateKey():
+            # Read for another module package or database
+            return None
+        if time.monotonic() - timestamp >= MIGRATION_STATE_CACHE_DURATION:
+            return None
+        return migration_summary, baseline
+
+    def __migrationState(self):
+        """Return the migration summary and baseline version of the installed module.
+
+        Both are None if the module is not installed. The result is re-used for
+        MIGRATION_STATE_CACHE_DURATION seconds, so the module info refresh and the
+        following click handlers query the database once.
+        """
+        state = self.__cachedMigrationState()
+        if state is None:
+            key = self.__migrationStateKey()
+            state = probe_migrations(*key)
+            self.__cacheMigrationState(key, *state)
+        return state
+
+    def __probeMigrationState(self, callback):
+        """Call callback(migration_summary, baseline) once the migration state is known.
+
+        Unless cached, the migration table is read in a background thread so the UI
+        doesn't freeze on slow database connections.
+        """
+        state = self.__cachedMigrationState()
+        if state is not None:
+            callback(*state)
+            return
+
+        if self.__migration_probe_task.isRunning():
+            # Answered when the running read finishes, a newer click replaces an older one
+            self.__migration_probe_callback = (callback, self.__migrationStateKey())
+            return
+
+        self.__migration_probe_key = self.__migrationStateKey()
+        self.__migration_probe_callback = (callback, self.__migration_probe_key)
+        self.__migration_probe_task.start_probe(*self.__migration_probe_key)
+
+    def __onMigrationProbeFinished(self, migration_summary, baseline, exception):
+        callback, callback_key = self.__migration_probe_callback
+        self.__migration_probe_callback = None
+        key = self.__migrationStateKey()
+        if callback_key != key:
+            # Module package or database changed since the click
+            return
+
+        if self.__migration_probe_key != key:
+            # Clicked after a module package or database change, read the new state
+            self.__migration_probe_task.wait()
+            self.__probeMigrationState(callback)
+            return
+
+        if exception is not None:
+            MessageBar.pushErrorToBar(
+                self, self.tr("Can't read the module state from the database:"), exception
+            )
+            return
+
+        self.__cacheMigrationState(self.__migration_probe_key, migration_summary, baseline)
+        callback(migration_summary, baseline)
+
     def __show_error_state(self, message: str, on_label=None):
         """Display an error state and hide the widget content."""
         label = on_label or self.moduleInfo_installation_label_upgrade
@@ -633,20 +880,21 @@ class ModuleWidget(QWidget, DIALOG_UI):
         module_name = self.__current_module_package.module.name
         module_id = self.__current_module_package.module.id
         self.moduleInfo_installation_label_install.setHtml(
-            self.tr(f"No module <b>{module_name} ({module_id})</b> installed")
+            self.tr("No module <b>%s (%s)</b> installed") % (module_name, module_id)
         )
         self.__style_info_label(self.moduleInfo_installation_label_install)
         self.__adjust_text_browser_height(self.moduleInfo_installation_label_install)
-        self.moduleInfo_install_pushButton.setText(self.tr(f"Install {version}"))
+        self.moduleInfo_install_pushButton.setText(self.tr("Install %s") % version)
 
         self.moduleInfo_stackedWidget.setCurrentWidget(self.moduleInfo_stackedWidget_pageInstall)
         # Ensure the stacked widget is visible when showing a valid page
         self.moduleInfo_stackedWidget.setVisible(True)
 
     def __replace_label_with_text_browser(self, label_name: str):
-        """Replace a QLabel with a QTextBrowser for scrollable installation info."""
-        from qgis.PyQt.QtWidgets import QGridLayout
+        """Replace a QLabel with a QTextBrowser for scrollable installation info.
 
+        Returns the replaced label, it is left to the caller to delete it.
+        """
         old_label = getattr(self, label_name)
         parent_layout = old_label.parentWidget().layout()
 
@@ -661,14 +909,14 @@ class ModuleWidget(QWidget, DIALOG_UI):
         if idx >= 0 and isinstance(parent_layout, QGridLayout):
             row, col, rowspan, colspan = parent_layout.getItemPosition(idx)
             parent_layout.removeWidget(old_label)
-            old_label.deleteLater()
             parent_layout.addWidget(browser, row, col, rowspan, colspan)
         else:
             parent_layout.removeWidget(old_label)
-            old_label.deleteLater()
             parent_layout.addWidget(browser)
 
+        old_label.hide()
         setattr(self, label_name, browser)
+        return old_label
 
     def __build_installation_text(
         self,
@@ -681,52 +929,40 @@ class ModuleWidget(QWidget, DIALOG_UI):
         parameters: dict | None = None,
     ) -> str:
         """Build rich HTML installation info text shown above the action pages."""
-        lines = []
-        lines.append(f"<b>Module:</b> {module_name}")
+        buffer = io.StringIO()
+        write = buffer.write
+        write(f"<b>Module:</b> {module_name}")
         if schema:
-            lines.append(f"<b>Schema:</b> {schema}")
-        lines.append(f"<b>Version:</b> {baseline_version}")
+            write(f"<br><b>Schema:</b> {schema}")
+        write(f"<br><b>Version:</b> {baseline_version}")
         if beta_testing:
-            lines.append("\u26a0\ufe0f <b>Beta testing</b>")
+            write("<br>\u26a0\ufe0f <b>Beta testing</b>")
         if installed_date:
-            try:
-                lines.append(f"<b>Installed:</b> {installed_date.strftime('%Y-%m-%d %H:%M')}")
-            except AttributeError:
-                lines.append(f"<b>Installed:</b> {installed_date}")
+            write(f"<br><b>Installed:</b> {ModuleWidget.__format_date(installed_date)}")
         if upgrade_date:
-            try:
-                lines.append(f"<b>Last upgrade:</b> {upgrade_date.strftime('%Y-%m-%d %H:%M')}")
-            except AttributeError:
-                lines.append(f"<b>Last upgrade:</b> {upgrade_date}")
+            write(f"<br><b>Last upgrade:</b> {ModuleWidget.__format_date(upgrade_date)}")
         if parameters and isinstance(parameters, dict):
-            lines.append("<br><b>Parameters:</b>")
+            write("<br><br><b>Parameters:</b>")
             for param_name, param_value in parameters.items():
-                lines.append(f"&nbsp;&nbsp;{param_name} = {param_value}")
-        return "<br>".join(lines)
+                write(f"<br>&nbsp;&nbsp;{param_name} = {param_value}")
+        return buffer.getvalue()
+
+    @staticmethod
+    def __format_date(value) -> str:
+        """Format a migration date as YYYY-MM-DD HH:MM, without going through strftime."""
+        try:
+            # Drop the time zone so isoformat doesn't append the UTC offset
+            return value.replace(tzinfo=None).isoformat(sep=" ", timespec="minutes")
+        except (AttributeError, TypeError):
+            return str(value)
 
     @staticmethod
     def __style_info_label(label, warning: bool = False):
         """Apply a framed style to an installation info label."""
-        if warning:
-            label.setStyleSheet(
-                "QTextBrowser { "
-                "  background-color: #fff3cd; "
-                "  border: 1px solid #e0c76a; "
-                "  border-radius: 4px; "
-                "  padding: 6px; "
-                "  color: #664d03; "
-                "}"
-            )
-        else:
-            label.setStyleSheet(
-                "QTextBrowser { "
-                "  background-color: #f5f5f5; "
-                "  border: 1px solid #d0d0d0; "
-                "  border-radius: 4px; "
-                "  padding: 6px; "
-                "  color: #333333; "
-                "}"
-            )
+        style_sheet = INFO_LABEL_STYLE_WARNING if warning else INFO_LABEL_STYLE_NORMAL
+        # Setting a style sheet re-polishes the widget even if it did not change
+        if label.styleSheet() != style_sheet:
+            label.setStyleSheet(style_sheet)
 
     @staticmethod
     def __adjust_text_browser_height(browser):
@@ -751,7 +987,7 @@ class ModuleWidget(QWidget, DIALOG_UI):
         self.__set_installation_label(
             self.moduleInfo_installation_label_upgrade, install_text, beta_testing
         )
-        self.moduleInfo_upgrade_pushButton.setText(self.tr(f"Upgrade to {target_version}"))
+        self.moduleInfo_upgrade_pushButton.setText(self.tr("Upgrade to %s") % target_version)
 
         self.moduleInfo_stackedWidget.setCurrentWidget(self.moduleInfo_stackedWidget_pageUpgrade)
         self.moduleInfo_stackedWidget.setVisible(True)
@@ -794,16 +1030,14 @@ class ModuleWidget(QWidget, DIALOG_UI):
         beta_testing: bool = False,
     ):
         """Switch to maintain page with limited operations when selected version is older than installed."""
-        warning_text = (
-            install_text
-            + "<br><br>"
-            + self.tr(
-                f"<b>The selected version ({target_version}) is older than the installed version ({baseline_version}).</b><br>"
-                f"Maintenance operations are not available. "
-                f"Please select the matching version ({baseline_version}) to perform maintenance."
-            )
+        mismatch_text = self.tr(
+            "<b>The selected version (%s) is older than the installed version (%s).</b><br>"
+            "Maintenance operations are not available. "
+            "Please select the matching version (%s) to perform maintenance."
+        ) % (target_version, baseline_version, baseline_version)
+        self.moduleInfo_installation_label_maintain.setHtml(
+            f"{install_text}<br><br>{mismatch_text}"
         )
-        self.moduleInfo_installation_label_maintain.setHtml(warning_text)
         self.__style_info_label(self.moduleInfo_installation_label_maintain, warning=True)
         self.__adjust_text_browser_height(self.moduleInfo_installation_label_maintain)
 
@@ -833,6 +1067,10 @@ class ModuleWidget(QWidget, DIALOG_UI):
             btn.setEnabled(has_uninstall)
             btn.setToolTip(tooltip)
 
+    def __scheduleUpdateModuleInfo(self):
+        """Update the module info once control returns to the event loop."""
+        self.__update_module_info_timer.start()
+
     def __updateModuleInfo(self):
         if self.__current_module_package is None:
             self.__show_no_module_selected_page()
@@ -848,14 +1086,12 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
         target_version = self.__pum_config.last_version()
         module_name = self.__current_module_package.module.name
-        sm = SchemaMigrations(self.__pum_config)
 
         self.moduleInfo_stackedWidget.setEnabled(True)
 
-        if sm.exists(self.__database_connection):
+        migration_summary, baseline_version = self.__migrationState()
+        if migration_summary is not None:
             # Module is installed - determine which page to show
-            baseline_version = sm.baseline(self.__database_connection)
-            migration_summary = sm.migration_summary(self.__database_connection)
             installed_beta_testing = migration_summary.get("beta_testing", False)
 
             install_text = self.__build_installation_text(
@@ -941,22 +1177,48 @@ class ModuleWidget(QWidget, DIALOG_UI):
 
     def __cancelOperationClicked(self):
         """Cancel the current operation."""
+        self.__requestCancel()
+        logger.info("Operation cancel requested by user")
+
+    def __requestCancel(self):
         self.moduleInfo_cancel_button.setEnabled(False)
-        self.moduleInfo_cancel_button.setText(self.tr("Canceling..."))
+        self.moduleInfo_cancel_button.setText(self.__texts["canceling"])
         self.__operation_task.cancel()
-        logger.info("Operation cancel requested by user")
         # Don't wait here - the __onOperationFinished signal will handle UI cleanup
 
         # Start a timeout timer in case the operation hangs
         self.__cancel_timeout_timer.start(5000)  # 5 second timeout
 
+    def __cancelOperationThen(self, reason: str, action):
+        """Cancel the running operation and call action once it has stopped.
+
+        The operation still uses the current package, PUM config and connection
+        until it stops, so they must not be replaced or cleaned up before.
+        """
+        logger.warning(f"Canceling running operation due to {reason}")
+        self.__pending_after_operation.append(action)
+        if not self.__cancel_timeout_timer.isActive():
+            self.__requestCancel()
+
+    def __runPendingAfterOperation(self):
+        """Apply the state changes requested while the operation was running."""
+        actions = self.__pending_after_operation
+        if not actions:
+            return
+        self.__pending_after_operation = []
+        for action in actions:
+            action()
+        self.__scheduleUpdateModuleInfo()
+
     def __onCancelTimeout(self):
         """Handle timeout when cancel doesn't complete."""
         if self.__operation_task.isRunning():
             logger.error("Operation did not respond to cancel request, forcing termination")
             self.__operation_task.terminate()
+            self.__operation_task.wait()
             # Force UI reset
             self.__resetOperationUI()
+            self.__runPendingAfterOperation()
             # Show warning
             MessageBar.pushWarningToBar(
                 self,
@@ -988,9 +1250,15 @@ class ModuleWidget(QWidget, DIALOG_UI):
         # Stop the timeout timer if running
         self.__cancel_timeout_timer.stop()
 
+        # The finished signal is the last thing the thread does, let it return
+        self.__operation_task.wait()
+
         # Always reset UI state, even if already reset
         self.__resetOperationUI()
 
+        # The operation changed the database
+        self.__migration_state_cache = None
+
         if success:
             # Show success message
             module_name = self.__current_module_package.module.name
@@ -998,41 +1266,47 @@ class ModuleWidget(QWidget, DIALOG_UI):
             if operation == "install":
                 self.tr("Module installed")
                 target_version = self.__pum_config.last_version()
-                message = self.tr(
-                    f"Module '{module_name}' has been installed ({target_version}) successfully."
+                message = self.tr("Module '%s' has been installed (%s) successfully.") % (
+                    module_name,
+                    target_version,
                 )
             elif operation == "upgrade":
                 self.tr("Module upgraded")
                 target_version = self.__pum_config.last_version()
-                message = self.tr(
-                    f"Module '{module_name}' has been upgraded to {target_version} successfully."
+                message = self.tr("Module '%s' has been upgraded to %s successfully.") % (
+                    module_name,
+                    target_version,
                 )
             elif operation == "uninstall":
                 self.tr("Module uninstalled")
-                message = self.tr(f"Module '{module_name}' has been uninstalled successfully.")
+                message = self.tr("Module '%s' has been uninstalled successfully.") % module_name
             elif operation == "roles":
                 self.tr("Roles created")
-                message = self.tr(
-                    f"Roles for module '{module_name}' have been created and granted successfully."
+                message = (
+                    self.tr("Roles for module '%s' have been created and granted successfully.")
+                    % module_name
                 )
             elif operation == "recreate_app":
                 self.tr("Application recreated")
-                message = self.tr(
-                    f"Application schema of module '{module_name}' has been recreated successfully."
+                message = (
+                    self.tr("Application schema of module '%s' has been recreated successfully.")
+                    % module_name
                 )
             else:
                 self.tr("Task completed")
-                message = self.tr(f"Task on module '{module_name}' completed successfully.")
+                message = self.tr("Task on module '%s' completed successfully.") % module_name
 
             MessageBar.pushSuccessToBar(self, message)
             logger.info(message)
 
             # Refresh module info
-            self.__updateModuleInfo()
+            self.__scheduleUpdateModuleInfo()
 
             # Signal that an operation finished (for refreshing installed modules list)
             self.signal_operationFinished.emit()
         else:
             # Show error message only if there's an actual error (not just cancellation)
             if error_message:
-                MessageBar.pushErrorToBar(self, self.tr(f"Operation failed: {error_message}"))
+                MessageBar.pushErrorToBar(self, self.tr("Operation failed: %s") % error_message)
+
+        self.__runPendingAfterOperation()
@@ -1,108 +1,170 @@
 import logging
+from functools import lru_cache, partial
 
-try:
-    from qgis.gui import QgsFileWidget
-except ImportError:
-    QgsFileWidget = None
-
-from qgis.PyQt.QtWidgets import (
-    QCheckBox,
-    QComboBox,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QWidget,
-)
+from qgis.PyQt.QtWidgets import QCheckBox, QComboBox, QLineEdit
 
 from ..libs.pum import ParameterDefinition, ParameterType
 
 logger = logging.getLogger(__name__)
 
 
-class ParameterWidget(QWidget):
-    def __init__(self, parameter_definition: ParameterDefinition, parent):
-        QWidget.__init__(self, parent)
-        self.layout = QHBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(self.layout)
-        self.value = None
-
-        # Get the parameter type value (handle both enum and string cases)
-        # This is needed because during plugin reload, enums can become strings
-        param_type = parameter_definition.type
-        if isinstance(param_type, ParameterType):
-            param_type_value = param_type.value
-        elif isinstance(param_type, str):
-            # Handle string representations like "ParameterType.INTEGER" or "integer"
-            param_type_value = (
-                param_type.split(".")[-1].lower() if "." in param_type else param_type.lower()
-            )
-        else:
-            param_type_value = str(param_type).split(".")[-1].lower()
+@lru_cache(maxsize=1)
+def _qgs_file_widget_class():
+    """Return QgsFileWidget, or None when running outside of QGIS.
+
+    Imported on first use, most modules have no path parameters.
+    """
+    try:
+        from qgis.gui import QgsFileWidget
+    except ImportError:
+        return None
+    return QgsFileWidget
+
+
+@lru_cache(maxsize=32)
+def _normalize_param_type(param_type) -> str:
+    """Return the lowercase type name of a parameter type.
+
+    Handles both enum and string cases, this is needed because during
+    plugin reload, enums can become strings.
+    """
+    if isinstance(param_type, ParameterType):
+        return param_type.value
+    if isinstance(param_type, str):
+        # Handle string representations like "ParameterType.INTEGER" or "integer"
+        return param_type.rsplit(".", 1)[-1].lower()
+    return str(param_type).rsplit(".", 1)[-1].lower()
+
+
+def _build_boolean(parameter_definition: ParameterDefinition, parent):
+    widget = QCheckBox(parameter_definition.name, parent)
+    reset = partial(widget.setChecked, bool(parameter_definition.default))
+    reset()
+    return widget, widget.isChecked, reset
 
-        tooltip = parameter_definition.description or ""
 
-        if param_type_value != "boolean":
-            label = QLabel(parameter_definition.name, self)
-            label.setToolTip(tooltip)
-            self.layout.addWidget(label)
+def _combobox_value(widget: QComboBox, convert):
+    return convert(widget.currentData())
 
-        if param_type_value == "boolean":
-            self.widget = QCheckBox(parameter_definition.name, self)
-            self.widget.setToolTip(tooltip)
+
+def _line_edit_value(widget: QLineEdit, convert):
+    # Fall back to the default shown as placeholder
+    value = widget.text() or widget.placeholderText()
+    if convert is None:
+        return value
+    return convert(value)
+
+
+def _scalar_builder(convert=None):
+    """Return a builder for a decimal, integer or text parameter.
+
+    A combobox is used if the parameter has a list of values, a line edit otherwise.
+    """
+
+    def build(parameter_definition: ParameterDefinition, parent):
+        if parameter_definition.values:
+            widget = QComboBox(parent)
+            for v in parameter_definition.values:
+                widget.addItem(str(v), v)
+            idx = -1
             if parameter_definition.default is not None:
-                self.widget.setChecked(parameter_definition.default)
-            self.layout.addWidget(self.widget)
-            self.layout.addStretch()
-            self.value = lambda: self.widget.isChecked()
-        elif param_type_value in ("decimal", "integer", "text"):
-            if parameter_definition.values:
-                self.widget = QComboBox(self)
-                self.widget.setToolTip(tooltip)
-                for v in parameter_definition.values:
-                    self.widget.addItem(str(v), v)
-                if parameter_definition.default is not None:
-                    idx = self.widget.findData(parameter_definition.default)
-                    if idx >= 0:
-                        self.widget.setCurrentIndex(idx)
-                self.layout.addWidget(self.widget)
-                self.layout.addStretch()
-                if param_type_value == "integer":
-                    self.value = lambda: int(self.widget.currentData())
-                elif param_type_value == "decimal":
-                    self.value = lambda: float(self.widget.currentData())
-                else:
-                    self.value = lambda: self.widget.currentData()
-            else:
-                self.widget = QLineEdit(self)
-                self.widget.setToolTip(tooltip)
-                if parameter_definition.default is not None:
-                    self.widget.setPlaceholderText(str(parameter_definition.default))
-                self.layout.addWidget(self.widget)
-                if param_type_value == "integer":
-                    self.value = lambda: int(self.widget.text() or self.widget.placeholderText())
-                elif param_type_value == "decimal":
-                    self.value = lambda: float(self.widget.text() or self.widget.placeholderText())
-                else:
-                    self.value = lambda: self.widget.text() or self.widget.placeholderText()
-        elif param_type_value == "path":
-            if QgsFileWidget is not None:
-                self.widget = QgsFileWidget(self)
-                self.widget.setToolTip(tooltip)
-                self.widget.setStorageMode(QgsFileWidget.StorageMode.GetFile)
-                if parameter_definition.default is not None:
-                    self.widget.setFilePath(str(parameter_definition.default))
-                self.layout.addWidget(self.widget)
-                self.value = lambda: self.widget.filePath()
-            else:
-                self.widget = QLineEdit(self)
-                self.widget.setToolTip(tooltip)
-                if parameter_definition.default is not None:
-                    self.widget.setText(str(parameter_definition.default))
-                self.layout.addWidget(self.widget)
-                self.value = lambda: self.widget.text()
-        else:
+                idx = widget.findData(parameter_definition.default)
+            # The first value is selected if the default is not in the list
+            reset = partial(widget.setCurrentIndex, max(idx, 0))
+            reset()
+            if convert is None:
+                return widget, widget.currentData, reset
+            return widget, partial(_combobox_value, widget, convert), reset
+
+        widget = QLineEdit(parent)
+        if parameter_definition.default is not None:
+            widget.setPlaceholderText(str(parameter_definition.default))
+        # An empty line edit stands for the default
+        return widget, partial(_line_edit_value, widget, convert), widget.clear
+
+    return build
+
+
+def _build_path(parameter_definition: ParameterDefinition, parent):
+    default = "" if parameter_definition.default is None else str(parameter_definition.default)
+    file_widget_class = _qgs_file_widget_class()
+    if file_widget_class is not None:
+        widget = file_widget_class(parent)
+        widget.setStorageMode(file_widget_class.StorageMode.GetFile)
+        reset = partial(widget.setFilePath, default)
+        reset()
+        return widget, widget.filePath, reset
+
+    widget = QLineEdit(parent)
+    reset = partial(widget.setText, default)
+    reset()
+    return widget, widget.text, reset
+
+
+def _set_combo_box_value(widget: QComboBox, value):
+    idx = widget.findData(value)
+    if idx < 0:
+        idx = widget.findText(str(value))
+    if idx >= 0:
+        widget.setCurrentIndex(idx)
+
+
+_VALUE_SETTERS = {
+    QCheckBox: lambda widget, value: widget.setChecked(bool(value)),
+    QComboBox: _set_combo_box_value,
+    QLineEdit: lambda widget, value: widget.setText(str(value)),
+}
+
+
+@lru_cache(maxsize=None)
+def _value_setter(widget_class):
+    """Return the function setting a value on widgets of the given class, None if unsupported."""
+    for cls in widget_class.__mro__:
+        setter = _VALUE_SETTERS.get(cls)
+        if setter is not None:
+            return setter
+    # QgsFileWidget or other widgets with setText/setFilePath
+    if hasattr(widget_class, "setFilePath"):
+        return lambda widget, value: widget.setFilePath(str(value))
+    if hasattr(widget_class, "setText"):
+        return lambda widget, value: widget.setText(str(value))
+    return None
+
+
+# Widget builder for each parameter type, returning the widget, its value getter
+# and the function restoring its default value
+_BUILDERS = {
+    "boolean": _build_boolean,
+    "integer": _scalar_builder(int),
+    "decimal": _scalar_builder(float),
+    "text": _scalar_builder(),
+    "path": _build_path,
+}
+
+
+class ParameterWidget:
+    """Editor widget of a parameter, laid out in a row of a ParametersGroupBox.
+
+    label_text is shown in the label column, it is empty for booleans as
+    the check box carries the parameter name. value returns the current
+    value, set_value sets it (None if the widget type is not supported)
+    and reset restores the default value.
+    """
+
+    def __init__(self, parameter_definition: ParameterDefinition, parent):
+        param_type_value = _normalize_param_type(parameter_definition.type)
+        builder = _BUILDERS.get(param_type_value)
+        if builder is None:
             raise ValueError(
                 f"Unknown parameter type '{parameter_definition.type}' "
                 f"(normalized to '{param_type_value}')"
             )
+
+        self.tooltip = parameter_definition.description or ""
+        self.label_text = "" if param_type_value == "boolean" else parameter_definition.name
+        self.widget, self.value, self.reset = builder(parameter_definition, parent)
+        self.widget.setToolTip(self.tooltip)
+
+        # Resolved once here rather than on every value set
+        setter = _value_setter(type(self.widget))
+        self.set_value = partial(setter, self.widget) if setter is not None else None
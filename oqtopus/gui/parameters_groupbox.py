@@ -1,12 +1,6 @@
 import logging
 
-from qgis.PyQt.QtWidgets import (
-    QCheckBox,
-    QComboBox,
-    QGroupBox,
-    QLineEdit,
-    QSizePolicy,
-)
+from qgis.PyQt.QtWidgets import QFormLayout, QGroupBox, QSizePolicy
 
 from ..libs.pum import ParameterDefinition
 from .parameter_widget import ParameterWidget
@@ -22,21 +16,71 @@ class ParametersGroupBox(QGroupBox):
         # Don't expand vertically beyond what the contents need
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
 
+        # One row per parameter, only line edits take the remaining width
+        layout = QFormLayout(self)
+        layout.setContentsMargins(3, 3, 3, 3)
+        layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+
     def setParameters(self, parameters: list[ParameterDefinition]):
         logger.debug(f"Setting parameters in ParametersGroupBox ({len(parameters)})")
-        self.clean()
-        self.parameters = parameters
+        if self.parameter_widgets and list(parameters) == self.parameters:
+            # Same definitions in the same order, only the values are reset
+            for pw in self.parameter_widgets.values():
+                pw.reset()
+            return
+
+        new_parameters = {parameter.name: parameter for parameter in parameters}
 
         if not parameters:
+            self.clean()
+            self.parameters = parameters
             self.setVisible(False)
             return
 
-        self.setVisible(True)
+        # Lay out and repaint once, after all parameter widgets are added
+        layout = self.layout()
+        self.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        try:
+            # Keep the widgets of unchanged parameters, only the others are deleted.
+            # Kept widgets are detached with removeWidget, QFormLayout.takeRow
+            # is not safe to use from Python.
+            kept_rows = {}
+            for parameter in self.parameters:
+                pw = self.parameter_widgets[parameter.name]
+                if new_parameters.get(parameter.name) != parameter:
+                    layout.removeRow(pw.widget)
+                    continue
+                label = layout.labelForField(pw.widget)
+                if label is not None:
+                    layout.removeWidget(label)
+                layout.removeWidget(pw.widget)
+                # Values entered for the previous module version are not carried over
+                pw.reset()
+                kept_rows[parameter.name] = (pw, label)
+            # Drop the rows left empty by the kept widgets
+            while layout.rowCount():
+                layout.removeRow(0)
 
-        for parameter in parameters:
-            pw = ParameterWidget(parameter, self)
-            self.layout().addWidget(pw)
-            self.parameter_widgets[parameter.name] = pw
+            self.parameters = parameters
+            self.parameter_widgets = {}
+            for parameter in parameters:
+                if parameter.name in kept_rows:
+                    pw, label = kept_rows[parameter.name]
+                    layout.addRow(label, pw.widget)
+                else:
+                    pw = ParameterWidget(parameter, self)
+                    layout.addRow(pw.label_text, pw.widget)
+                    if pw.label_text:
+                        layout.labelForField(pw.widget).setToolTip(pw.tooltip)
+                self.parameter_widgets[parameter.name] = pw
+        finally:
+            layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+
+        # Shown once populated, so the rows are not laid out one by one
+        self.setVisible(True)
 
     def parameters_values(self):
         values = {}
@@ -45,37 +89,31 @@ class ParametersGroupBox(QGroupBox):
         return values
 
     def setParametersEnabled(self, enabled: bool):
-        """Enable or disable the parameter widgets without affecting the scroll area."""
+        """Enable or disable the parameter rows without affecting the scroll area."""
+        layout = self.layout()
         for pw in self.parameter_widgets.values():
-            pw.setEnabled(enabled)
+            pw.widget.setEnabled(enabled)
+            label = layout.labelForField(pw.widget)
+            if label is not None:
+                label.setEnabled(enabled)
 
     def setParameterValues(self, values: dict):
         """Pre-set parameter widget values from a dict (e.g. installed parameters)."""
         for name, value in values.items():
             pw = self.parameter_widgets.get(name)
-            if pw is None:
-                continue
-            widget = pw.widget
-            if isinstance(widget, QCheckBox):
-                widget.setChecked(bool(value))
-            elif isinstance(widget, QComboBox):
-                idx = widget.findData(value)
-                if idx >= 0:
-                    widget.setCurrentIndex(idx)
-                else:
-                    idx = widget.findText(str(value))
-                    if idx >= 0:
-                        widget.setCurrentIndex(idx)
-            elif isinstance(widget, QLineEdit):
-                widget.setText(str(value))
-            else:
-                # QgsFileWidget or other widgets with setText/setFilePath
-                if hasattr(widget, "setFilePath"):
-                    widget.setFilePath(str(value))
-                elif hasattr(widget, "setText"):
-                    widget.setText(str(value))
+            if pw is not None and pw.set_value is not None:
+                pw.set_value(value)
 
     def clean(self):
-        for widget in self.parameter_widgets.values():
-            widget.deleteLater()
+        # Removing a row deletes its label and editor widget right away,
+        # lay out and repaint once when all rows are gone
+        layout = self.layout()
+        self.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        try:
+            while layout.rowCount():
+                layout.removeRow(layout.rowCount() - 1)
+        finally:
+            layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
         self.parameter_widgets = {}
@@ -103,7 +103,7 @@ class PluginWidget(QWidget, DIALOG_UI):
         # Check if the package exists
         if not os.path.exists(asset_plugin.package_zip):
             self.info_label.setText(
-                self.tr(f"Plugin zip file '{asset_plugin.package_zip}' does not exist.")
+                self.tr("Plugin zip file '%s' does not exist.") % asset_plugin.package_zip
             )
             QtUtils.setForegroundColor(self.info_label, PluginUtils.COLOR_WARNING)
             QtUtils.setFontItalic(self.info_label, True)
@@ -113,7 +113,8 @@ class PluginWidget(QWidget, DIALOG_UI):
         self.__plugin_name = self.__extractPluginName(asset_plugin.package_zip)
         if not self.__plugin_name:
             self.info_label.setText(
-                self.tr(f"Couldn't determinate the plugin name for '{asset_plugin.package_zip}'.")
+                self.tr("Couldn't determinate the plugin name for '%s'.")
+                % asset_plugin.package_zip
             )
             QtUtils.setForegroundColor(self.info_label, PluginUtils.COLOR_WARNING)
             QtUtils.setFontItalic(self.info_label, True)
@@ -138,7 +139,7 @@ class PluginWidget(QWidget, DIALOG_UI):
         asset_plugin = self.__current_module_package.asset_plugin
         if not os.path.exists(asset_plugin.package_zip):
             MessageBar.pushErrorToBar(
-                self, self.tr(f"Plugin zip file '{asset_plugin.package_zip}' does not exist.")
+                self, self.tr("Plugin zip file '%s' does not exist.") % asset_plugin.package_zip
             )
             return
 
@@ -160,19 +161,20 @@ class PluginWidget(QWidget, DIALOG_UI):
             if Qgis.QGIS_VERSION_INT < 34408:
                 version = self.__getInstalledPluginVersion(self.__plugin_name)
                 MessageBar.pushSuccessToBar(
-                    self, self.tr(f"Current '{self.__plugin_name}' plugin version is {version}")
+                    self,
+                    self.tr("Current '%s' plugin version is %s") % (self.__plugin_name, version),
                 )
                 self.__packagePrepareGetPluginFilename()
                 return
 
             if not success:
                 MessageBar.pushErrorToBar(
-                    self, self.tr(f"Plugin '{self.__plugin_name}' installation failed.")
+                    self, self.tr("Plugin '%s' installation failed.") % self.__plugin_name
                 )
                 return
 
             MessageBar.pushSuccessToBar(
-                self, self.tr(f"Plugin '{self.__plugin_name}' installed successfully.")
+                self, self.tr("Plugin '%s' installed successfully.") % self.__plugin_name
             )
             self.__packagePrepareGetPluginFilename()
 
@@ -196,9 +198,8 @@ class PluginWidget(QWidget, DIALOG_UI):
         if self.__current_module_package.html_url is None:
             MessageBar.pushWarningToBar(
                 self,
-                self.tr(
-                    f"Changelog not available for version '{self.__current_module_package.display_name()}'."
-                ),
+                self.tr("Changelog not available for version '%s'.")
+                % self.__current_module_package.display_name(),
             )
             return
 
@@ -215,7 +216,7 @@ class PluginWidget(QWidget, DIALOG_UI):
         asset_plugin = self.__current_module_package.asset_plugin
         if not os.path.exists(asset_plugin.package_zip):
             self.info_label.setText(
-                self.tr(f"Plugin zip file '{asset_plugin.package_zip}' does not exist.")
+                self.tr("Plugin zip file '%s' does not exist.") % asset_plugin.package_zip
             )
             QtUtils.setForegroundColor(self.info_label, PluginUtils.COLOR_WARNING)
             QtUtils.setFontItalic(self.info_label, True)
@@ -238,19 +239,18 @@ class PluginWidget(QWidget, DIALOG_UI):
 
         # Copy the plugin package to the selected directory
         try:
-            shutil.copy2(asset_plugin.package_zip, install_filename)
+            shutil.copy(asset_plugin.package_zip, install_filename)
 
             MessageBar.pushSuccessToBar(
-                self, self.tr(f"Plugin package has been copied to '{install_filename}'.")
+                self, self.tr("Plugin package has been copied to '%s'.") % install_filename
             )
         except Exception as e:
-            MessageBar.pushErrorToBar(self, self.tr(f"Failed to copy plugin package: {e}"))
+            MessageBar.pushErrorToBar(self, self.tr("Failed to copy plugin package: %s") % e)
             return
 
     def __extractPluginName(self, package_zip: str) -> str:
         with ZipFile(package_zip, "r") as zip_ref:
             for name in zip_ref.namelist():
-                print(f"name: {name}")
                 if name.endswith("/metadata.txt"):
                     return name.split("/")[0]
         return ""
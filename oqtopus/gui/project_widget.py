@@ -1,7 +1,7 @@
 import os
 import shutil
 
-from qgis.PyQt.QtCore import QUrl
+from qgis.PyQt.QtCore import QObject, QRunnable, QThreadPool, QUrl, pyqtSignal
 from qgis.PyQt.QtGui import QDesktopServices
 from qgis.PyQt.QtWidgets import QFileDialog, QMessageBox, QWidget
 
@@ -22,6 +22,93 @@ from ..utils.qt_utils import QtUtils
 DIALOG_UI = PluginUtils.get_ui_class("project_widget.ui")
 
 
+# Package directory -> (package zip path and modification time, project file) of the last search
+_project_file_cache = {}
+
+
+def _search_project_file(package_dir: str) -> str | None:
+    """Walk package_dir, hidden directories included, for a QGIS project file."""
+    for root, dirs, files in os.walk(package_dir):
+        for file in files:
+            if file.endswith((".qgz", ".qgs")):
+                return os.path.join(root, file)
+    return None
+
+
+def _find_project_file(package_dir: str, package_zip: str | None) -> str | None:
+    """Return the first QGIS project file (.qgz or .qgs) found in package_dir, or None.
+
+    package_dir is extracted from package_zip, the result is re-used until
+    another zip file is extracted there.
+    """
+    if package_zip is None:
+        # Not extracted from a zip file, nothing tells when it changes
+        return _search_project_file(package_dir)
+    try:
+        zip_key = (package_zip, os.stat(package_zip).st_mtime_ns)
+    except OSError:
+        return _search_project_file(package_dir)
+
+    cached = _project_file_cache.get(package_dir)
+    if cached is not None and cached[0] == zip_key:
+        if cached[1] is None or os.path.isfile(cached[1]):
+            return cached[1]
+
+    project_file = _search_project_file(package_dir)
+    _project_file_cache[package_dir] = (zip_key, project_file)
+    return project_file
+
+
+def _copy_project_files(entries, install_destination: str, service: str | None):
+    """Copy the package directory entries to install_destination, patching project files."""
+    # Timestamps of the package files are not worth extra syscalls
+    for entry in entries:
+        destination_path = os.path.join(install_destination, entry.name)
+
+        if entry.is_dir():
+            shutil.copytree(
+                entry.path,
+                destination_path,
+                dirs_exist_ok=True,
+                copy_function=shutil.copy,
+            )
+
+        elif entry.name.endswith((".qgs", ".qgz")):
+            patch_project_file(entry.path, destination_path, service)
+
+        else:
+            shutil.copy(entry.path, destination_path)
+
+
+class _ProjectInstallSignals(QObject):
+    # Emitted with the install destination, the settings key parts of the installed
+    # module version and the exception, None on success
+    finished = pyqtSignal(str, list, object)
+
+
+class ProjectInstallRunnable(QRunnable):
+    """Copies the project files in a thread pool thread.
+
+    Extracting and re-packing .qgz projects can take a while for large projects.
+    """
+
+    def __init__(self, entries, install_destination: str, service: str | None, key_parts: list):
+        super().__init__()
+        self.entries = entries
+        self.install_destination = install_destination
+        self.service = service
+        self.key_parts = key_parts
+        self.signals = _ProjectInstallSignals()
+
+    def run(self):
+        try:
+            _copy_project_files(self.entries, self.install_destination, self.service)
+        except Exception as e:
+            self.signals.finished.emit(self.install_destination, self.key_parts, e)
+            return
+        self.signals.finished.emit(self.install_destination, self.key_parts, None)
+
+
 class ProjectWidget(QWidget, DIALOG_UI):
 
     def __init__(self, parent=None):
@@ -37,6 +124,7 @@ class ProjectWidget(QWidget, DIALOG_UI):
 
         self.__current_module_package = None
         self.__current_service = None
+        self.__install_runnable = None
 
     def setModulePackage(self, module_package: ModulePackage):
         self.__current_module_package = module_package
@@ -98,27 +186,17 @@ class ProjectWidget(QWidget, DIALOG_UI):
         # Check if the directory exists
         if not os.path.exists(asset_project.package_dir):
             self.project_info_label.setText(
-                self.tr(f"Project directory '{asset_project.package_dir}' does not exist.")
+                self.tr("Project directory '%s' does not exist.") % asset_project.package_dir
             )
             QtUtils.setForegroundColor(self.project_info_label, PluginUtils.COLOR_WARNING)
             QtUtils.setFontItalic(self.project_info_label, True)
             return
 
-        project_file = None
-        for root, dirs, files in os.walk(asset_project.package_dir):
-            for file in files:
-                if file.endswith(".qgz") or file.endswith(".qgs"):
-                    project_file = os.path.join(root, file)
-                    break
-
-            if project_file:
-                break
-
+        project_file = _find_project_file(asset_project.package_dir, asset_project.package_zip)
         if project_file is None:
             self.project_info_label.setText(
-                self.tr(
-                    f"No QGIS project file (.qgz or .qgs) found into {asset_project.package_dir}."
-                ),
+                self.tr("No QGIS project file (.qgz or .qgs) found into %s.")
+                % asset_project.package_dir,
             )
             QtUtils.setForegroundColor(self.project_info_label, PluginUtils.COLOR_WARNING)
             QtUtils.setFontItalic(self.project_info_label, True)
@@ -146,6 +224,11 @@ class ProjectWidget(QWidget, DIALOG_UI):
 
     def __updateInstallButton(self):
         """Disable the install button for dev branches (project is used from cache)."""
+        if self.__install_runnable is not None:
+            # Enabled again once the running installation is finished
+            self.project_install_pushButton.setEnabled(False)
+            return
+
         if self.__current_module_package is None:
             self.project_install_pushButton.setEnabled(True)
             self.project_install_pushButton.setToolTip("")
@@ -187,6 +270,9 @@ class ProjectWidget(QWidget, DIALOG_UI):
 
     def __projectInstallClicked(self):
 
+        if self.__install_runnable is not None:
+            return
+
         if self.__current_module_package is None:
             MessageBar.pushWarningToBar(self, self.tr("Please select a module and version first."))
             return
@@ -208,11 +294,15 @@ class ProjectWidget(QWidget, DIALOG_UI):
         if not install_destination:
             return
 
+        # DirEntry objects carry the file type, no further stat is needed to copy them
+        with os.scandir(asset_project.package_dir) as entries:
+            entries = list(entries)
+
         # Check for existing files that would be overwritten
         existing_files = [
-            item
-            for item in os.listdir(asset_project.package_dir)
-            if os.path.exists(os.path.join(install_destination, item))
+            entry.name
+            for entry in entries
+            if os.path.exists(os.path.join(install_destination, entry.name))
         ]
         if existing_files:
             reply = QMessageBox.question(
@@ -228,31 +318,29 @@ class ProjectWidget(QWidget, DIALOG_UI):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        # Copy the project files to the selected directory
-        try:
-            # Copy all files from asset_project to install_destination
-            for item in os.listdir(asset_project.package_dir):
-                source_path = os.path.join(asset_project.package_dir, item)
-                destination_path = os.path.join(install_destination, item)
-
-                if os.path.isdir(source_path):
-                    shutil.copytree(source_path, destination_path, dirs_exist_ok=True)
+        # Copy the project files to the selected directory off the GUI thread, the
+        # module version may change before the copy is finished
+        self.__install_runnable = ProjectInstallRunnable(
+            entries, install_destination, self.__current_service, self.__dynamicKeyParts()
+        )
+        self.__install_runnable.signals.finished.connect(self.__onProjectInstallFinished)
+        self.__updateInstallButton()
+        QThreadPool.globalInstance().start(self.__install_runnable)
 
-                elif item.endswith((".qgs", ".qgz")):
-                    patch_project_file(source_path, destination_path, self.__current_service)
+    def __onProjectInstallFinished(self, install_destination: str, key_parts: list, exception):
+        self.__install_runnable = None
+        self.__updateInstallButton()
 
-                else:
-                    shutil.copy2(source_path, destination_path)
+        if exception is not None:
+            MessageBar.pushErrorToBar(self, self.tr("Failed to copy project file: %s") % exception)
+            return
 
-            MessageBar.pushSuccessToBar(
-                self, self.tr(f"Project files have been copied to '{install_destination}'.")
-            )
+        MessageBar.pushSuccessToBar(
+            self, self.tr("Project files have been copied to '%s'.") % install_destination
+        )
 
-            # Remember installed project file path for "Open in QGIS"
-            self.__saveInstalledProjectPath(install_destination)
-        except Exception as e:
-            MessageBar.pushErrorToBar(self, self.tr(f"Failed to copy project file: {e}"))
-            return
+        # Remember installed project file path for "Open in QGIS"
+        self.__saveInstalledProjectPath(install_destination, key_parts)
 
     def __dynamicKeyParts(self):
         """Return the dynamic key parts [module_id, version] for the settings entry."""
@@ -262,13 +350,14 @@ class ProjectWidget(QWidget, DIALOG_UI):
         version = self.__current_module_package.name or ""
         return [module_id, version]
 
-    def __saveInstalledProjectPath(self, install_destination):
-        """Find the .qgz/.qgs file in *install_destination* and persist its path."""
+    def __saveInstalledProjectPath(self, install_destination, key_parts):
+        """Find the .qgz/.qgs file in *install_destination* and persist its path.
+
+        *key_parts* are the dynamic key parts of the module version the project was
+        installed for.
+        """
         if not HAS_QGIS:
             return
-        key_parts = self.__dynamicKeyParts()
-        if key_parts is None:
-            return
         # Find the project file that was copied
         from ..core.settings import Settings
 
@@ -317,12 +406,12 @@ class ProjectWidget(QWidget, DIALOG_UI):
                 ModulePackage.Type.PULL_REQUEST,
             )
             if is_dev and self.__current_module_package.asset_project is not None:
-                package_dir = self.__current_module_package.asset_project.package_dir
+                asset_project = self.__current_module_package.asset_project
+                package_dir = asset_project.package_dir
                 if package_dir and os.path.isdir(package_dir):
-                    for root, dirs, files in os.walk(package_dir):
-                        for file in files:
-                            if file.endswith((".qgz", ".qgs")):
-                                return os.path.join(root, file)
+                    project_file = _find_project_file(package_dir, asset_project.package_zip)
+                    if project_file is not None:
+                        return project_file
         return self.__getInstalledProjectPath()
 
     def __openProjectInQgis(self):
@@ -362,9 +451,8 @@ class ProjectWidget(QWidget, DIALOG_UI):
         if self.__current_module_package.html_url is None:
             MessageBar.pushWarningToBar(
                 self,
-                self.tr(
-                    f"Changelog not available for version '{self.__current_module_package.display_name()}'."
-                ),
+                self.tr("Changelog not available for version '%s'.")
+                % self.__current_module_package.display_name(),
             )
             return
 
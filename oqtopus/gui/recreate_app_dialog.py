@@ -41,27 +41,20 @@ class RecreateAppDialog(QDialog):
         description.setWordWrap(True)
         layout.addWidget(description)
 
+        # Parameter widgets are only built when the dialog is shown
+        self.__standard_params = standard_params
+        self.__app_only_params = app_only_params
+        self.__installed_parameters = installed_parameters
+        self.__parameters_built = False
+
         # Standard parameters (read-only)
         self.__standard_groupbox = ParametersGroupBox(self)
         self.__standard_groupbox.setTitle(self.tr("Parameters"))
-        gb_layout = QVBoxLayout()
-        gb_layout.setContentsMargins(3, 3, 3, 3)
-        self.__standard_groupbox.setLayout(gb_layout)
-        self.__standard_groupbox.setParameters(standard_params)
-        self.__standard_groupbox.setParametersEnabled(False)
-        if installed_parameters:
-            self.__standard_groupbox.setParameterValues(installed_parameters)
         layout.addWidget(self.__standard_groupbox)
 
         # App-only parameters (editable)
         self.__app_only_groupbox = ParametersGroupBox(self)
         self.__app_only_groupbox.setTitle(self.tr("Application parameters"))
-        gb_layout = QVBoxLayout()
-        gb_layout.setContentsMargins(3, 3, 3, 3)
-        self.__app_only_groupbox.setLayout(gb_layout)
-        self.__app_only_groupbox.setParameters(app_only_params)
-        if installed_parameters:
-            self.__app_only_groupbox.setParameterValues(installed_parameters)
         layout.addWidget(self.__app_only_groupbox)
 
         # Add stretch to push buttons to the bottom
@@ -76,9 +69,30 @@ class RecreateAppDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def showEvent(self, event):
+        if not self.__parameters_built:
+            self.__buildParameters()
+            # The dialog was sized before the parameters were added
+            self.adjustSize()
+        super().showEvent(event)
+
+    def __buildParameters(self):
+        self.__parameters_built = True
+
+        self.__standard_groupbox.setParameters(self.__standard_params)
+        self.__standard_groupbox.setParametersEnabled(False)
+        if self.__installed_parameters:
+            self.__standard_groupbox.setParameterValues(self.__installed_parameters)
+
+        self.__app_only_groupbox.setParameters(self.__app_only_params)
+        if self.__installed_parameters:
+            self.__app_only_groupbox.setParameterValues(self.__installed_parameters)
+
     def parameters(self) -> dict:
         """Return combined parameter values from both groupboxes."""
-        values = {}
-        values.update(self.__standard_groupbox.parameters_values())
-        values.update(self.__app_only_groupbox.parameters_values())
-        return values
+        if not self.__parameters_built:
+            self.__buildParameters()
+        return {
+            **self.__standard_groupbox.parameters_values(),
+            **self.__app_only_groupbox.parameters_values(),
+        }
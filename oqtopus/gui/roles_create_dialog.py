@@ -2,6 +2,7 @@
 
 import logging
 
+from qgis.PyQt.QtCore import QTimer
 from qgis.PyQt.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -48,10 +49,20 @@ class RolesCreateDialog(QDialog):
         layout.addWidget(self._button_box)
 
         # Disable OK when nothing is selected
+        self._has_selection = True
+        self._pending_ok_update = False
         self._roles_widget.selectionChanged.connect(self._update_ok_button)
 
     def _update_ok_button(self, has_selection: bool):
-        self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(has_selection)
+        # Apply only the last selection state of the event loop iteration
+        self._has_selection = has_selection
+        if not self._pending_ok_update:
+            self._pending_ok_update = True
+            QTimer.singleShot(0, self._flush_ok_update)
+
+    def _flush_ok_update(self):
+        self._pending_ok_update = False
+        self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(self._has_selection)
 
     def roles_options(self) -> dict:
         """Return the roles options dict."""
@@ -1,8 +1,9 @@
 """Reusable widget and checkable groupbox for role creation options."""
 
-import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 
-from qgis.PyQt.QtCore import pyqtSignal
+from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot
 from qgis.PyQt.QtWidgets import (
     QCheckBox,
     QGroupBox,
@@ -12,7 +13,8 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
-logger = logging.getLogger(__name__)
+# Options of an unchecked RolesGroupBox, read-only as it is shared
+_DISABLED_ROLES_OPTIONS = MappingProxyType({"roles": False, "grant": False})
 
 
 class RolesWidget(QWidget):
@@ -32,11 +34,10 @@ class RolesWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        layout = QVBoxLayout(self)
+        # --- Specific roles row, the only one so it is the widget layout ---
+        layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # --- Specific roles row ---
-        specific_layout = QHBoxLayout()
         self._specific_checkbox = QCheckBox(self.tr("Create specific role(s) with suffix"), self)
         self._specific_checkbox.setChecked(False)
         self._specific_checkbox.setToolTip(
@@ -46,28 +47,41 @@ class RolesWidget(QWidget):
                 "and grant them to the generic roles."
             )
         )
-        specific_layout.addWidget(self._specific_checkbox)
+        layout.addWidget(self._specific_checkbox)
 
         self._suffix_edit = QLineEdit(self)
         self._suffix_edit.setPlaceholderText(self.tr("e.g. lausanne"))
         self._suffix_edit.setEnabled(False)
-        specific_layout.addWidget(self._suffix_edit)
-        layout.addLayout(specific_layout)
+        layout.addWidget(self._suffix_edit)
+
+        # Stripped suffix, updated on each edit
+        self._suffix = ""
+        # Last state emitted with selectionChanged
+        self._last_selection = self.has_selection()
 
         # --- Wiring ---
-        self._specific_checkbox.toggled.connect(self._on_specific_toggled)
+        # The suffix edit is enabled by Qt directly, without a Python slot
+        self._specific_checkbox.toggled.connect(self._suffix_edit.setEnabled)
+        self._specific_checkbox.toggled.connect(self._emit_selection_changed)
         self._suffix_edit.textChanged.connect(self._on_suffix_changed)
 
     # ------------------------------------------------------------------
     # Slots
     # ------------------------------------------------------------------
 
-    def _on_specific_toggled(self, checked: bool):
-        self._suffix_edit.setEnabled(checked)
-        self.selectionChanged.emit(self.has_selection())
+    @pyqtSlot(str)
+    def _on_suffix_changed(self, text: str):
+        self._suffix = text.strip()
+        self._emit_selection_changed()
 
-    def _on_suffix_changed(self):
-        self.selectionChanged.emit(self.has_selection())
+    @pyqtSlot()
+    def _emit_selection_changed(self):
+        # Only emit when the selection validity actually changes
+        has_selection = self.has_selection()
+        if has_selection == self._last_selection:
+            return
+        self._last_selection = has_selection
+        self.selectionChanged.emit(has_selection)
 
     # ------------------------------------------------------------------
     # Public API
@@ -79,7 +93,7 @@ class RolesWidget(QWidget):
         Always valid (generic roles are always created).  Only invalid
         when specific roles are checked but the suffix is empty.
         """
-        if self._specific_checkbox.isChecked() and not self._suffix_edit.text().strip():
+        if self._specific_checkbox.isChecked() and not self._suffix:
             return False
         return True
 
@@ -92,9 +106,7 @@ class RolesWidget(QWidget):
             grant (bool): Always True.
             suffix (str | None): Suffix for specific roles, or None.
         """
-        suffix = self._suffix_edit.text().strip() if self._specific_checkbox.isChecked() else None
-        if suffix == "":
-            suffix = None
+        suffix = (self._suffix or None) if self._specific_checkbox.isChecked() else None
 
         return {
             "roles": True,
@@ -119,14 +131,24 @@ class RolesGroupBox(QGroupBox):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(6, 6, 6, 6)
 
+        # Built on first show, a dialog that is never shown doesn't need it
+        self._roles_widget = None
+
+    def showEvent(self, event):
+        self._ensure_roles_widget()
+        super().showEvent(event)
+
+    def _ensure_roles_widget(self):
+        if self._roles_widget is not None:
+            return
         self._roles_widget = RolesWidget(self)
-        layout.addWidget(self._roles_widget)
+        self.layout().addWidget(self._roles_widget)
+        # Children added after the groupbox was shown are not shown with it
+        self._roles_widget.show()
 
-    def roles_options(self) -> dict:
-        """Return a dict suitable for ``create_roles()`` / upgrader options."""
+    def roles_options(self) -> Mapping:
+        """Return a mapping suitable for ``create_roles()`` / upgrader options."""
         if not self.isChecked():
-            return {
-                "roles": False,
-                "grant": False,
-            }
+            return _DISABLED_ROLES_OPTIONS
+        self._ensure_roles_widget()
         return self._roles_widget.roles_options()
@@ -2,8 +2,8 @@
 
 import logging
 
-from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtGui import QCursor
+from qgis.PyQt.QtCore import QAbstractItemModel, QModelIndex, Qt
+from qgis.PyQt.QtGui import QCursor, QFont
 from qgis.PyQt.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -17,8 +17,7 @@ from qgis.PyQt.QtWidgets import (
     QMessageBox,
     QPushButton,
     QTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
 )
 
@@ -34,6 +33,123 @@ _ROLE_STATUS_ROLE = Qt.ItemDataRole.UserRole
 _GROUP_SUFFIX_ROLE = Qt.ItemDataRole.UserRole + 1  # suffix str stored on group headers
 _USER_NAME = Qt.ItemDataRole.UserRole + 2  # str stored on user items
 
+_DETAILS_COLUMN = 3
+
+
+class _RoleNode:
+    """A row of the roles tree: a group header, a role or a user.
+
+    Built in plain Python by the dialog, RolesTreeModel serves it to the view.
+    """
+
+    def __init__(
+        self,
+        parent,
+        texts: list[str],
+        *,
+        header: bool = False,
+        tooltip: str | None = None,
+        role_status=None,
+        group_suffix: str | None = None,
+        user_name: str | None = None,
+    ):
+        self.parent = parent
+        self.children = []
+        self.row = 0
+        self.texts = texts
+        self.header = header
+        self.tooltip = tooltip
+        self.role_status = role_status
+        self.group_suffix = group_suffix
+        self.user_name = user_name
+        if parent is not None:
+            self.row = len(parent.children)
+            parent.children.append(self)
+
+
+class RolesTreeModel(QAbstractItemModel):
+    """Roles tree model.
+
+    Rows are _RoleNode objects under an invisible root node, the texts and
+    item data of a row are only turned into Qt values when the view asks.
+    """
+
+    def __init__(self, headers: list[str], parent=None):
+        QAbstractItemModel.__init__(self, parent)
+        self.headers = headers
+        self.root = _RoleNode(None, [])
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    def set_root(self, root: _RoleNode):
+        """Replace the whole tree with the children of *root*."""
+        self.beginResetModel()
+        self.root = root
+        self.endResetModel()
+
+    def node_index(self, node: _RoleNode) -> QModelIndex:
+        """Return the index of the first column of *node*."""
+        return self.createIndex(node.row, 0, node)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: Qt.ItemDataRole = None):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def index(self, row: int, column: int, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        parent_node = parent.internalPointer() if parent.isValid() else self.root
+        return self.createIndex(row, column, parent_node.children[row])
+
+    def parent(self, index: QModelIndex):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self.root:
+            return QModelIndex()
+        return self.node_index(parent_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = parent.internalPointer() if parent.isValid() else self.root
+        return len(node.children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.headers)
+
+    def data(self, index: QModelIndex, role: Qt.ItemDataRole = None):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.texts[column] if column < len(node.texts) else None
+        if column == _DETAILS_COLUMN:
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return node.tooltip
+            return None
+        if column != 0:
+            return None
+        if role == Qt.ItemDataRole.FontRole:
+            return self._header_font if node.header else None
+        if role == _ROLE_STATUS_ROLE:
+            return node.role_status
+        if role == _GROUP_SUFFIX_ROLE:
+            return node.group_suffix
+        if role == _USER_NAME:
+            return node.user_name
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.internalPointer().header:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
 
 class RolesManageDialog(QDialog):
     """Manage database roles: check status, create, grant, revoke, drop."""
@@ -69,15 +185,19 @@ class RolesManageDialog(QDialog):
         layout.addWidget(self._summary_label)
 
         # --- Tree ---
-        self._tree = QTreeWidget(self)
-        self._tree.setHeaderLabels(
+        self._model = RolesTreeModel(
             [
                 self.tr("Role"),
                 self.tr("Status"),
                 self.tr("Login"),
                 self.tr("Details"),
-            ]
+            ],
+            self,
         )
+        self._tree = QTreeView(self)
+        self._tree.setModel(self._model)
+        for col in range(self._model.columnCount()):
+            self._tree.header().setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
         self._tree.setRootIsDecorated(True)
         self._tree.setAlternatingRowColors(True)
         self._tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -153,8 +273,26 @@ class RolesManageDialog(QDialog):
             self._summary_label.setText(summary)
 
         # --- Tree ---
-        tree = self._tree
-        tree.clear()
+        # Build the whole tree without intermediate repaints / signals
+        self._tree.setUpdatesEnabled(False)
+        self._tree.blockSignals(True)
+        try:
+            self._populate_tree(result)
+        finally:
+            self._tree.blockSignals(False)
+            self._tree.setUpdatesEnabled(True)
+
+    def _populate_tree(self, result: RoleInventory):
+        root = _RoleNode(None, [])
+
+        # Texts repeated on many rows, translated once per refresh
+        self._texts = {
+            "yes": self.tr("yes"),
+            "no": self.tr("no"),
+            "ok": self.tr("ok"),
+            "permissions mismatch": self.tr("permissions mismatch"),
+            "none": self.tr("none"),
+        }
 
         # ==============================================================
         # 1) MODULE ROLES (configured generic + suffixed + missing)
@@ -175,34 +313,28 @@ class RolesManageDialog(QDialog):
 
         has_module_roles = bool(generic_roles or missing_generic or specific_by_suffix)
         if has_module_roles:
-            module_header = QTreeWidgetItem(tree, [self.tr("Module roles")])
-            module_header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self._set_bold(module_header)
+            missing_text = f"{self._MISS} {self.tr('missing')}"
+            module_header = _RoleNode(root, [self.tr("Module roles")], header=True)
 
             # -- Generic sub-group --
             if generic_roles or missing_generic:
-                generic_header = QTreeWidgetItem(module_header, [self.tr("Generic roles")])
-                generic_header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                generic_header.setData(0, _GROUP_SUFFIX_ROLE, "")
-                self._set_bold(generic_header)
+                generic_header = _RoleNode(
+                    module_header, [self.tr("Generic roles")], header=True, group_suffix=""
+                )
 
                 for rs in generic_roles:
                     self._add_role_item(generic_header, rs)
                 for name in missing_generic:
-                    QTreeWidgetItem(
-                        generic_header,
-                        [name, f"{self._MISS} {self.tr('missing')}", "", ""],
-                    )
-                generic_header.setExpanded(True)
+                    _RoleNode(generic_header, [name, missing_text, "", ""])
 
             # -- Specific sub-groups --
             for suffix in sorted(specific_by_suffix):
-                suffix_header = QTreeWidgetItem(
-                    module_header, [self.tr("Specific roles (%s)") % suffix]
+                suffix_header = _RoleNode(
+                    module_header,
+                    [self.tr("Specific roles (%s)") % suffix],
+                    header=True,
+                    group_suffix=suffix,
                 )
-                suffix_header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                suffix_header.setData(0, _GROUP_SUFFIX_ROLE, suffix)
-                self._set_bold(suffix_header)
 
                 for rs in specific_by_suffix[suffix]:
                     self._add_role_item(suffix_header, rs)
@@ -210,72 +342,57 @@ class RolesManageDialog(QDialog):
                 found_config_names = {rs.role.name for rs in specific_by_suffix[suffix]}
                 for name in result.expected_roles:
                     if name not in found_config_names:
-                        suffixed_name = f"{name}_{suffix}"
-                        QTreeWidgetItem(
-                            suffix_header,
-                            [suffixed_name, f"{self._MISS} {self.tr('missing')}", "", ""],
-                        )
-                suffix_header.setExpanded(True)
-
-            module_header.setExpanded(True)
+                        _RoleNode(suffix_header, [f"{name}_{suffix}", missing_text, "", ""])
 
         # ==============================================================
         # 2) GRANTEE ROLES (users granted membership in module roles)
         # ==============================================================
         if result.grantee_roles:
-            grantee_header = QTreeWidgetItem(tree, [self.tr("Grantee roles")])
-            grantee_header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self._set_bold(grantee_header)
+            grantee_header = _RoleNode(root, [self.tr("Grantee roles")], header=True)
 
+            member_of_text = self.tr("member of: %s")
             for rs in result.grantee_roles:
                 member_of = ", ".join(rs.granted_to)
-                login_text = self.tr("yes") if rs.login else self.tr("no")
-                item = QTreeWidgetItem(
+                login_text = self._texts["yes"] if rs.login else self._texts["no"]
+                _RoleNode(
                     grantee_header,
-                    [rs.name, self._OK, login_text, self.tr("member of: %s") % member_of],
+                    [rs.name, self._OK, login_text, member_of_text % member_of],
+                    user_name=rs.name,
                 )
-                item.setData(0, _USER_NAME, rs.name)
-            grantee_header.setExpanded(True)
 
         # ==============================================================
         # 3) USERS (candidates — no schema access)
         # ==============================================================
         if result.other_login_roles:
-            users_header = QTreeWidgetItem(tree, [self.tr("Users")])
-            users_header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self._set_bold(users_header)
+            users_header = _RoleNode(root, [self.tr("Users")], header=True)
 
+            no_role_text = self.tr("no module role granted")
             for name in result.other_login_roles:
-                item = QTreeWidgetItem(
+                _RoleNode(
                     users_header,
-                    [name, "", self.tr("yes"), self.tr("no module role granted")],
+                    [name, "", self._texts["yes"], no_role_text],
+                    user_name=name,
                 )
-                item.setData(0, _USER_NAME, name)
-            users_header.setExpanded(True)
 
         # ==============================================================
         # 4) UNKNOWN ROLES (schema access but not configured or grantees)
         # ==============================================================
         if result.unknown_roles:
-            unknown_header = QTreeWidgetItem(tree, [self.tr("Unknown roles")])
-            unknown_header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self._set_bold(unknown_header)
+            unknown_header = _RoleNode(root, [self.tr("Unknown roles")], header=True)
 
+            schemas_text = self.tr("schemas: %s")
+            superuser_text = self.tr("superuser")
             for rs in result.unknown_roles:
                 schemas_str = ", ".join(rs.schemas)
-                detail = self.tr("schemas: %s") % schemas_str
+                detail = schemas_text % schemas_str
                 if rs.superuser:
-                    detail = self.tr("superuser") + " \u2014 " + detail
-                login_text = self.tr("yes") if rs.login else self.tr("no")
-                QTreeWidgetItem(
-                    unknown_header,
-                    [rs.name, self._WARN, login_text, detail],
-                )
-            unknown_header.setExpanded(True)
+                    detail = superuser_text + " \u2014 " + detail
+                login_text = self._texts["yes"] if rs.login else self._texts["no"]
+                _RoleNode(unknown_header, [rs.name, self._WARN, login_text, detail])
 
-        # Resize columns
-        for col in range(tree.columnCount()):
-            tree.header().setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        self._model.set_root(root)
+        # A single recursive expand, cheaper than expanding each group header
+        self._tree.expandAll()
 
     def _refresh(self):
         """Re-run roles_inventory and repopulate the dialog."""
@@ -389,21 +506,19 @@ class RolesManageDialog(QDialog):
     # Helpers
     # ------------------------------------------------------------------
 
-    def _add_role_item(self, parent: QTreeWidgetItem, rs) -> QTreeWidgetItem:
+    def _add_role_item(self, parent: _RoleNode, rs) -> _RoleNode:
         """Add a single role row under *parent*."""
         all_ok = all(sp.satisfied for sp in rs.schema_permissions)
         icon = self._OK if all_ok else self._WARN
-        status_text = self.tr("ok") if all_ok else self.tr("permissions mismatch")
-        login_text = self.tr("yes") if rs.login else self.tr("no")
+        status_text = self._texts["ok"] if all_ok else self._texts["permissions mismatch"]
+        login_text = self._texts["yes"] if rs.login else self._texts["no"]
         summary, tooltip = self._build_details(rs)
-        item = QTreeWidgetItem(
+        return _RoleNode(
             parent,
             [rs.name, f"{icon} {status_text}", login_text, summary],
+            tooltip=tooltip or None,
+            role_status=rs,
         )
-        if tooltip:
-            item.setToolTip(3, tooltip)
-        item.setData(0, _ROLE_STATUS_ROLE, rs)
-        return item
 
     def _build_details(self, rs) -> tuple[str, str]:
         """Build a short summary and an HTML tooltip for a configured role.
@@ -431,7 +546,7 @@ class RolesManageDialog(QDialog):
                     actual_bits.append("READ")
                 if sp.has_write:
                     actual_bits.append("WRITE")
-                actual = ", ".join(actual_bits) if actual_bits else self.tr("none")
+                actual = ", ".join(actual_bits) if actual_bits else self._texts["none"]
                 if sp.satisfied:
                     lines.append(f"&nbsp;&nbsp;\u2022 {sp.schema}: {expected}")
                 else:
@@ -448,12 +563,6 @@ class RolesManageDialog(QDialog):
         tooltip = "<br>".join(lines) if lines else ""
         return summary, tooltip
 
-    @staticmethod
-    def _set_bold(item: QTreeWidgetItem):
-        font = item.font(0)
-        font.setBold(True)
-        item.setFont(0, font)
-
     # ------------------------------------------------------------------
     # Context menu
     # ------------------------------------------------------------------
@@ -463,13 +572,14 @@ class RolesManageDialog(QDialog):
         if not self._connection or not self._role_manager:
             return
 
-        item = self._tree.itemAt(pos)
-        if item is None:
+        index = self._tree.indexAt(pos)
+        if not index.isValid():
             return
 
-        rs = item.data(0, _ROLE_STATUS_ROLE)
-        group_suffix = item.data(0, _GROUP_SUFFIX_ROLE)
-        user_name = item.data(0, _USER_NAME)
+        index = index.siblingAtColumn(0)
+        rs = index.data(_ROLE_STATUS_ROLE)
+        group_suffix = index.data(_GROUP_SUFFIX_ROLE)
+        user_name = index.data(_USER_NAME)
 
         if rs is not None:
             # Individual role item
@@ -622,19 +732,15 @@ class RolesManageDialog(QDialog):
     def _collect_module_roles(self) -> list[tuple]:
         """Return a list of (rs, db_role_name) for all existing module roles in the tree."""
         result = []
-        tree = self._tree
-        for i in range(tree.topLevelItemCount()):
-            top = tree.topLevelItem(i)
-            self._collect_roles_recursive(top, result)
+        self._collect_roles_recursive(self._model.root, result)
         return result
 
-    def _collect_roles_recursive(self, item: QTreeWidgetItem, result: list):
-        """Recursively collect items that have _ROLE_STATUS_ROLE data."""
-        rs = item.data(0, _ROLE_STATUS_ROLE)
-        if rs is not None:
-            result.append((rs, rs.name))
-        for i in range(item.childCount()):
-            self._collect_roles_recursive(item.child(i), result)
+    def _collect_roles_recursive(self, node: _RoleNode, result: list):
+        """Recursively collect nodes that hold a role status."""
+        if node.role_status is not None:
+            result.append((node.role_status, node.role_status.name))
+        for child in node.children:
+            self._collect_roles_recursive(child, result)
 
     def _fetch_role_memberships(self, user_name: str) -> set[str]:
         """Return the set of role names that *user_name* is a member of."""
@@ -50,7 +50,7 @@ class ServiceCreateDialog(QDialog, DIALOG_UI):
                 QMessageBox.critical(
                     self,
                     self.tr("Error"),
-                    self.tr(f"Service name '{service_name}' already exists."),
+                    self.tr("Service name '%s' already exists.") % service_name,
                 )
                 return
         except Exception:
@@ -77,7 +77,7 @@ class ServiceCreateDialog(QDialog, DIALOG_UI):
                 create_if_not_found=True,
             )
         except Exception as e:
-            error_text = self.tr(f"Error writing the new service configuration:\n{e}.")
+            error_text = self.tr("Error writing the new service configuration:\n%s.") % e
             logger.error(error_text)
             QMessageBox.critical(self, self.tr("Error"), error_text)
             return
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Mapping
 
 from qgis.PyQt.QtWidgets import (
     QCheckBox,
@@ -40,7 +41,7 @@ class UpgradeDialog(QDialog):
         parent=None,
     ):
         super().__init__(parent)
-        self.setWindowTitle(self.tr(f"Upgrade to {target_version}"))
+        self.setWindowTitle(self.tr("Upgrade to %s") % target_version)
         self.setMinimumWidth(400)
 
         layout = QVBoxLayout(self)
@@ -48,9 +49,10 @@ class UpgradeDialog(QDialog):
         # Description
         description = QLabel(
             self.tr(
-                f"You are about to upgrade to version <b>{target_version}</b>.\n\n"
+                "You are about to upgrade to version <b>%s</b>.\n\n"
                 "Please review the parameters and options below."
-            ),
+            )
+            % target_version,
             self,
         )
         description.setWordWrap(True)
@@ -59,9 +61,6 @@ class UpgradeDialog(QDialog):
         # Standard parameters (read-only on upgrade)
         self.__standard_groupbox = ParametersGroupBox(self)
         self.__standard_groupbox.setTitle(self.tr("Parameters"))
-        gb_layout = QVBoxLayout()
-        gb_layout.setContentsMargins(3, 3, 3, 3)
-        self.__standard_groupbox.setLayout(gb_layout)
         self.__standard_groupbox.setParameters(standard_params)
         self.__standard_groupbox.setParametersEnabled(False)
         if installed_parameters:
@@ -71,9 +70,6 @@ class UpgradeDialog(QDialog):
         # App-only parameters (editable)
         self.__app_only_groupbox = ParametersGroupBox(self)
         self.__app_only_groupbox.setTitle(self.tr("Application parameters"))
-        gb_layout = QVBoxLayout()
-        gb_layout.setContentsMargins(3, 3, 3, 3)
-        self.__app_only_groupbox.setLayout(gb_layout)
         self.__app_only_groupbox.setParameters(app_only_params)
         if installed_parameters:
             self.__app_only_groupbox.setParameterValues(installed_parameters)
@@ -118,7 +114,7 @@ class UpgradeDialog(QDialog):
             self,
         )
         button_box.button(QDialogButtonBox.StandardButton.Ok).setText(
-            self.tr(f"Upgrade to {target_version}")
+            self.tr("Upgrade to %s") % target_version
         )
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
@@ -174,10 +170,10 @@ class UpgradeDialog(QDialog):
 
     def parameters(self) -> dict:
         """Return combined parameter values from both groupboxes."""
-        values = {}
-        values.update(self.__standard_groupbox.parameters_values())
-        values.update(self.__app_only_groupbox.parameters_values())
-        return values
+        return {
+            **self.__standard_groupbox.parameters_values(),
+            **self.__app_only_groupbox.parameters_values(),
+        }
 
     def beta_testing(self) -> bool:
         """Return whether beta testing is checked."""
@@ -187,8 +183,8 @@ class UpgradeDialog(QDialog):
         """Return whether create and grant roles is checked."""
         return self.__roles_groupbox.isChecked()
 
-    def roles_options(self) -> dict:
-        """Return the full roles options dict."""
+    def roles_options(self) -> Mapping:
+        """Return the full roles options mapping."""
         return self.__roles_groupbox.roles_options()
 
     def skip_baseline_check(self) -> bool:
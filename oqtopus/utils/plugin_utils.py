@@ -23,6 +23,7 @@ import os
 from datetime import datetime
 from logging import LogRecord
 
+import requests
 from qgis.PyQt.QtCore import (
     QDir,
     QFileInfo,
@@ -34,6 +35,7 @@ from qgis.PyQt.QtCore import (
 )
 from qgis.PyQt.QtGui import QColor, QDesktopServices, QIcon
 from qgis.PyQt.uic import loadUiType
+from urllib3.util import Retry
 
 from ..libs.pum import SQL
 
@@ -47,6 +49,8 @@ class PluginUtils:
 
     logsDirectory = ""
     _file_handler = None
+    _github_session = None
+    _ui_classes = {}
 
     COLOR_GREEN = QColor(12, 167, 137)
     COLOR_WARNING = QColor(255, 165, 0)
@@ -122,6 +126,31 @@ class PluginUtils:
 
         return paths
 
+    @staticmethod
+    def github_session():
+        """Returns the shared HTTP session used for all GitHub requests.
+
+        Reusing a single ``requests.Session`` lets urllib3 keep the
+        connections to GitHub alive instead of doing a new TCP/TLS
+        handshake for every request. Transient server errors and rate
+        limiting (honouring ``Retry-After``) are retried with a backoff.
+        """
+        if PluginUtils._github_session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=16, max_retries=retry
+            )
+            session.mount("https://", adapter)
+            PluginUtils._github_session = session
+        return PluginUtils._github_session
+
     @staticmethod
     def get_plugin_icon_path(icon_filename):
         return os.path.join(PluginUtils.plugin_root_path(), "icons", icon_filename)
@@ -136,10 +165,17 @@ class PluginUtils:
            Can be filename.ui or subdirectory/filename.ui
         :param ui_file: The file of the ui in svir.ui
         :type ui_file: str
+
+        The generated class is cached, each .ui file is only parsed once per process.
         """
-        os.path.sep.join(ui_file.split("/"))
-        ui_file_path = os.path.abspath(os.path.join(PluginUtils.plugin_root_path(), "ui", ui_file))
-        return loadUiType(ui_file_path)[0]
+        ui_class = PluginUtils._ui_classes.get(ui_file)
+        if ui_class is None:
+            ui_file_path = os.path.abspath(
+                os.path.join(PluginUtils.plugin_root_path(), "ui", *ui_file.split("/"))
+            )
+            ui_class = loadUiType(ui_file_path)[0]
+            PluginUtils._ui_classes[ui_file] = ui_class
+        return ui_class
 
     @staticmethod
     def get_metadata_file_path():
@@ -18,6 +18,7 @@
 
 import traceback
 
+from qgis.PyQt.QtGui import QPalette
 from qgis.PyQt.QtWidgets import QApplication, QMessageBox
 
 
@@ -41,6 +42,9 @@ class QtUtils:
         :param color: The color to set.
         """
         palette = widget.palette()
+        if palette.color(widget.foregroundRole()) == color:
+            # Setting an identical palette still re-polishes the widget
+            return
         palette.setColor(widget.foregroundRole(), color)
         widget.setPalette(palette)
 
@@ -50,12 +54,10 @@ class QtUtils:
         Reset the foreground color of a widget to the default.
         :param widget: The widget to reset the foreground color for.
         """
-        palette = widget.palette()
-        palette.setColor(
-            widget.foregroundRole(),
-            QApplication.style().standardPalette().color(palette.ColorRole.WindowText),
+        QtUtils.setForegroundColor(
+            widget,
+            QApplication.style().standardPalette().color(QPalette.ColorRole.WindowText),
         )
-        widget.setPalette(palette)
 
     @staticmethod
     def setFontItalic(widget, italic):
@@ -64,6 +66,8 @@ class QtUtils:
         :param widget: The widget to set the font for.
         """
         font = widget.font()
+        if font.italic() == italic:
+            return
         font.setItalic(italic)
         widget.setFont(font)
 
@@ -0,0 +1,75 @@
+"""Tests for the log model and the batched log view updates of the LogsWidget.
+
+Requires:
+    - PyQt5 or PyQt6 (QGIS is NOT required — uses the standalone shim)
+"""
+
+import logging
+import sys
+
+import oqtopus._qgis_shim  # noqa: F401
+
+# isort: split
+# Ensure a QApplication exists (needed for Qt widgets)
+from qgis.PyQt.QtWidgets import QApplication  # noqa: E402
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+from qgis.PyQt.QtCore import QEventLoop, QTimer  # noqa: E402
+
+from oqtopus.gui.logs_widget import FLUSH_INTERVAL, LogModel, LogsWidget  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _wait(timeout_ms: int):
+    """Run the event loop for *timeout_ms* milliseconds."""
+    loop = QEventLoop()
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_log_model_add_logs_inserts_rows_once():
+    model = LogModel()
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    model.add_log(("2024-01-01 00:00:00", "INFO", "oqtopus", "first"))
+    model.add_logs(
+        [
+            ("2024-01-01 00:00:01", "WARNING", "oqtopus", "second"),
+            ("2024-01-01 00:00:02", "ERROR", "oqtopus.core", "third"),
+        ]
+    )
+    model.add_logs([])
+
+    assert inserted == [(0, 0), (1, 2)]
+    assert model.rowCount() == 3
+    assert model.log(2) == ["2024-01-01 00:00:02", "ERROR", "oqtopus.core", "third"]
+    assert model.index(1, 3).data() == "second"
+
+
+def test_logs_widget_adds_records_after_flush():
+    widget = LogsWidget()
+    try:
+        model = widget.logs_model
+        test_logger = logging.getLogger("oqtopus.tests.logs_widget")
+        test_logger.warning("first record")
+        test_logger.warning("second record")
+
+        # Records are buffered until the flush timer fires
+        assert model.rowCount() == 0
+
+        _wait(FLUSH_INTERVAL * 4)
+
+        messages = [model.log(row)[3] for row in range(model.rowCount())]
+        assert messages[-2:] == ["first record", "second record"]
+    finally:
+        widget.close()
@@ -0,0 +1,191 @@
+"""Tests for the GitHub API pagination of the Module class.
+
+The network access manager is replaced by a fake one, no request is sent.
+
+Requires:
+    - PyQt5 or PyQt6 (QGIS is NOT required — uses the standalone shim)
+"""
+
+import json
+import sys
+
+import oqtopus._qgis_shim  # noqa: F401
+
+# isort: split
+# Ensure a QApplication exists (needed for Qt widgets)
+from qgis.PyQt.QtWidgets import QApplication  # noqa: E402
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+from qgis.PyQt.QtCore import QByteArray  # noqa: E402
+from qgis.PyQt.QtNetwork import QNetworkReply  # noqa: E402
+
+from oqtopus.core.module import Module  # noqa: E402
+from oqtopus.core.settings import Settings  # noqa: E402
+from oqtopus.utils.plugin_utils import PluginUtils  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeSignal:
+    """Signal stand-in calling the slot as soon as it is connected."""
+
+    def connect(self, slot):
+        slot()
+
+
+class _FakeReply:
+    """Minimal stand-in for a finished QNetworkReply."""
+
+    def __init__(self, items, headers, status_code=200):
+        self.finished = _FakeSignal()
+        self.__body = json.dumps(items).encode() if items is not None else b""
+        self.__headers = headers
+        self.__status_code = status_code
+        self.request_url = None
+
+    def url(self):
+        return self.request_url
+
+    def error(self):
+        return QNetworkReply.NetworkError.NoError
+
+    def errorString(self):
+        return ""
+
+    def attribute(self, attribute):
+        return self.__status_code
+
+    def rawHeader(self, name):
+        return QByteArray(self.__headers.get(name.data().decode(), "").encode())
+
+    def readAll(self):
+        return QByteArray(self.__body)
+
+    def deleteLater(self):
+        pass
+
+
+class _FakeNetworkManager:
+    """Answers GET requests with the reply registered for their URL.
+
+    A list of replies answers successive requests of the same URL.
+    """
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.requested_urls = []
+        self.if_none_match = []
+
+    def get(self, request):
+        url = request.url().toString()
+        self.requested_urls.append(url)
+        self.if_none_match.append(request.rawHeader(QByteArray(b"If-None-Match")).data().decode())
+        reply = self.replies[url]
+        if isinstance(reply, list):
+            reply = reply.pop(0)
+        reply.request_url = request.url()
+        return reply
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_get_github_pages_follows_next_links(monkeypatch, tmp_path):
+    monkeypatch.setattr(PluginUtils, "plugin_cache_path", staticmethod(lambda: str(tmp_path)))
+    monkeypatch.setattr(Settings, "get_github_headers", staticmethod(lambda: {}))
+
+    first_url = "https://api.github.com/repos/org/repo/releases?per_page=2"
+    second_url = "https://api.github.com/repos/org/repo/releases?per_page=2&page=2"
+    last_url = "https://api.github.com/repos/org/repo/releases?per_page=2&page=3"
+    network_manager = _FakeNetworkManager(
+        {
+            first_url: _FakeReply(
+                [{"id": 1}, {"id": 2}],
+                {
+                    "ETag": '"abc"',
+                    "Link": f'<{second_url}>; rel="next", <{last_url}>; rel="last"',
+                },
+            ),
+            second_url: _FakeReply(
+                [{"id": 3}, {"id": 4}],
+                {"Link": f'<{first_url}>; rel="prev", <{last_url}>; rel="next"'},
+            ),
+            last_url: _FakeReply([{"id": 5}], {"Link": f'<{first_url}>; rel="first"'}),
+        }
+    )
+
+    module = Module("Test", "test", "org", "repo")
+    module.network_manager = network_manager
+    results = []
+    module._Module__get_github_pages(
+        first_url, "releases", lambda items, error: results.append((items, error))
+    )
+
+    assert network_manager.requested_urls == [first_url, second_url, last_url]
+    assert results == [([{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 5}], "")]
+
+    # All pages are cached together with the ETag of the first page
+    cache_dir = tmp_path / "github_api" / "org" / "repo"
+    assert json.loads((cache_dir / "releases.json").read_text()) == results[0][0]
+    assert (cache_dir / "releases.etag").read_text() == '"abc"'
+
+
+def test_get_github_pages_uses_cache_when_not_modified(monkeypatch, tmp_path):
+    monkeypatch.setattr(PluginUtils, "plugin_cache_path", staticmethod(lambda: str(tmp_path)))
+    monkeypatch.setattr(Settings, "get_github_headers", staticmethod(lambda: {}))
+
+    cache_dir = tmp_path / "github_api" / "org" / "repo"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "releases.json").write_text(json.dumps([{"id": 1}, {"id": 2}]))
+    (cache_dir / "releases.etag").write_text('"abc"')
+
+    url = "https://api.github.com/repos/org/repo/releases?per_page=2"
+    network_manager = _FakeNetworkManager({url: _FakeReply(None, {}, status_code=304)})
+
+    module = Module("Test", "test", "org", "repo")
+    module.network_manager = network_manager
+    results = []
+    module._Module__get_github_pages(
+        url, "releases", lambda items, error: results.append((items, error))
+    )
+
+    assert network_manager.if_none_match == ['"abc"']
+    assert results == [([{"id": 1}, {"id": 2}], "")]
+
+
+def test_get_github_pages_reloads_when_not_modified_cache_is_unreadable(monkeypatch, tmp_path):
+    monkeypatch.setattr(PluginUtils, "plugin_cache_path", staticmethod(lambda: str(tmp_path)))
+    monkeypatch.setattr(Settings, "get_github_headers", staticmethod(lambda: {}))
+
+    cache_dir = tmp_path / "github_api" / "org" / "repo"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "releases.json").write_text("[{")
+    (cache_dir / "releases.etag").write_text('"abc"')
+
+    url = "https://api.github.com/repos/org/repo/releases?per_page=2"
+    network_manager = _FakeNetworkManager(
+        {
+            url: [
+                _FakeReply(None, {}, status_code=304),
+                _FakeReply([{"id": 1}], {"ETag": '"def"'}),
+            ]
+        }
+    )
+
+    module = Module("Test", "test", "org", "repo")
+    module.network_manager = network_manager
+    results = []
+    module._Module__get_github_pages(
+        url, "releases", lambda items, error: results.append((items, error))
+    )
+
+    # Requested again without the stale ETag
+    assert network_manager.if_none_match == ['"abc"', ""]
+    assert results == [([{"id": 1}], "")]
+    assert json.loads((cache_dir / "releases.json").read_text()) == [{"id": 1}]
+    assert (cache_dir / "releases.etag").read_text() == '"def"'
@@ -10,6 +10,7 @@ Requires:
 """
 
 import sys
+import time
 import types
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -97,14 +98,34 @@ def _make_module_package(source_dir: str, module: _FakeModule) -> ModulePackage:
     return pkg
 
 
+def _wait_for_module_info(widget: ModuleWidget, timeout_ms: int = 10000):
+    """Process events until the PUM config, module info and module state are read (or timeout).
+
+    The widget loads the PUM config and reads the module state in the background
+    and refreshes the module info once control returns to the event loop.
+    """
+    deadline = time.monotonic() + timeout_ms / 1000
+    while widget.isUpdatePending() and time.monotonic() < deadline:
+        loop = QEventLoop()
+        QTimer.singleShot(10, loop.quit)
+        loop.exec()
+
+
 def _wait_for_operation(widget: ModuleWidget, timeout_ms: int = 10000):
-    """Block until ModuleWidget.signal_operationFinished is emitted (or timeout)."""
-    if not widget.isOperationRunning():
-        return
-    loop = QEventLoop()
-    widget.signal_operationFinished.connect(loop.quit)
-    QTimer.singleShot(timeout_ms, loop.quit)
-    loop.exec()
+    """Block until the operation started by a click is finished (or timeout).
+
+    Upgrade and uninstall only start once the module state is read, the module
+    info is refreshed after the operation.
+    """
+    _wait_for_module_info(widget, timeout_ms)
+    if widget.isOperationRunning():
+        loop = QEventLoop()
+        widget.signal_operationFinished.connect(loop.quit)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+    # Deliver the finished signal of an operation thread that has just ended
+    QApplication.processEvents()
+    _wait_for_module_info(widget, timeout_ms)
 
 
 def _configure_mock_dialog(cls_mock, *, roles: bool = False, suffix: str | None = None):
@@ -206,6 +227,7 @@ class TestModuleWidgetInstall:
         """When a module is not installed, the install page should be shown."""
         module_widget.setModulePackage(simple_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         # The stacked widget should show the install page
         current_page = module_widget.moduleInfo_stackedWidget.currentWidget()
@@ -225,6 +247,7 @@ class TestModuleWidgetInstall:
 
         module_widget.setModulePackage(simple_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         # Click the install button
         module_widget.moduleInfo_install_pushButton.click()
@@ -261,6 +284,7 @@ class TestModuleWidgetInstall:
 
         module_widget.setModulePackage(simple_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
         module_widget.moduleInfo_install_pushButton.click()
         _wait_for_operation(module_widget)
 
@@ -289,6 +313,7 @@ class TestModuleWidgetUpgrade:
 
         module_widget.setModulePackage(simple_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         # Step 1: Install at version 1.0.0 (need to temporarily restrict max_version)
         # We use the operation task directly for the initial install at 1.0.0
@@ -300,6 +325,7 @@ class TestModuleWidgetUpgrade:
 
         # Step 2: Refresh the widget to detect the installed 1.0.0
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         # Verify upgrade page is shown (1.1.0 > 1.0.0)
         current_page = module_widget.moduleInfo_stackedWidget.currentWidget()
@@ -337,6 +363,7 @@ class TestModuleWidgetUninstall:
 
         module_widget.setModulePackage(simple_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         # Install first
         module_widget.moduleInfo_install_pushButton.click()
@@ -388,6 +415,7 @@ class TestModuleWidgetRoles:
 
         module_widget.setModulePackage(roles_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         module_widget.moduleInfo_install_pushButton.click()
         _wait_for_operation(module_widget)
@@ -434,6 +462,7 @@ class TestModuleWidgetRoles:
 
         module_widget.setModulePackage(roles_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         module_widget.moduleInfo_install_pushButton.click()
         _wait_for_operation(module_widget)
@@ -472,6 +501,7 @@ class TestModuleWidgetUninstallDisabled:
 
         module_widget.setModulePackage(roles_module_package)
         module_widget.setDatabaseConnection(db_connection)
+        _wait_for_module_info(module_widget)
 
         # Install the module
         module_widget.moduleInfo_install_pushButton.click()
@@ -0,0 +1,100 @@
+"""Tests for the parameter widgets reuse of the ParametersGroupBox.
+
+Requires:
+    - PyQt5 or PyQt6 (QGIS is NOT required — uses the standalone shim)
+"""
+
+import sys
+
+import oqtopus._qgis_shim  # noqa: F401
+
+# isort: split
+# Ensure a QApplication exists (needed for Qt widgets)
+from qgis.PyQt.QtWidgets import QApplication  # noqa: E402
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+from oqtopus.gui.parameters_groupbox import ParametersGroupBox  # noqa: E402
+from oqtopus.libs.pum import ParameterDefinition  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_set_parameters_keeps_unchanged_widgets():
+    groupbox = ParametersGroupBox(None)
+    groupbox.setParameters(
+        [
+            ParameterDefinition("srid", "integer", default=2056),
+            ParameterDefinition("lang", "text", default="fr"),
+        ]
+    )
+    srid_widget = groupbox.parameter_widgets["srid"].widget
+    lang_widget = groupbox.parameter_widgets["lang"].widget
+    srid_widget.setText("21781")
+    lang_widget.setText("de")
+
+    # Same definitions, nothing is rebuilt but the values are reset to the defaults
+    groupbox.setParameters(
+        [
+            ParameterDefinition("srid", "integer", default=2056),
+            ParameterDefinition("lang", "text", default="fr"),
+        ]
+    )
+    assert groupbox.parameter_widgets["srid"].widget is srid_widget
+    assert groupbox.parameters_values() == {"srid": 2056, "lang": "fr"}
+    srid_widget.setText("21781")
+
+    # Only the changed definition gets a new widget
+    groupbox.setParameters(
+        [
+            ParameterDefinition("srid", "integer", default=2056),
+            ParameterDefinition("lang", "text", default="it"),
+            ParameterDefinition("demo", "boolean", default=True),
+        ]
+    )
+    assert groupbox.parameter_widgets["srid"].widget is srid_widget
+    assert groupbox.parameter_widgets["lang"].widget is not lang_widget
+    assert groupbox.parameters_values() == {"srid": 2056, "lang": "it", "demo": True}
+    assert groupbox.layout().rowCount() == 3
+
+
+def test_set_parameters_resets_kept_widgets():
+    parameters = [
+        ParameterDefinition("demo", "boolean", default=True),
+        ParameterDefinition("lang", "text", default="fr", values=["de", "fr", "it"]),
+    ]
+    groupbox = ParametersGroupBox(None)
+    groupbox.setParameters(parameters)
+    groupbox.setParameterValues({"demo": False, "lang": "it"})
+    assert groupbox.parameters_values() == {"demo": False, "lang": "it"}
+
+    groupbox.setParameters(parameters + [ParameterDefinition("srid", "integer", default=2056)])
+    assert groupbox.parameters_values() == {"demo": True, "lang": "fr", "srid": 2056}
+
+
+def test_set_parameters_enabled_disables_rows():
+    groupbox = ParametersGroupBox(None)
+    groupbox.setParameters(
+        [
+            ParameterDefinition("srid", "integer", default=2056),
+            ParameterDefinition("demo", "boolean", default=True),
+        ]
+    )
+    groupbox.setParametersEnabled(False)
+
+    srid_widget = groupbox.parameter_widgets["srid"].widget
+    assert not srid_widget.isEnabled()
+    assert not groupbox.layout().labelForField(srid_widget).isEnabled()
+    assert not groupbox.parameter_widgets["demo"].widget.isEnabled()
+
+
+def test_set_parameters_empty_hides_groupbox():
+    groupbox = ParametersGroupBox(None)
+    groupbox.setParameters([ParameterDefinition("srid", "integer", default=2056)])
+    groupbox.setParameters([])
+
+    assert groupbox.parameter_widgets == {}
+    assert groupbox.layout().rowCount() == 0
+    assert groupbox.isHidden()
@@ -0,0 +1,148 @@
+"""Tests for the roles tree model of the RolesManageDialog.
+
+Requires:
+    - PyQt5 or PyQt6 (QGIS is NOT required — uses the standalone shim)
+"""
+
+import importlib
+import sys
+
+import oqtopus._qgis_shim  # noqa: F401
+
+# isort: split
+# Ensure a QApplication exists (needed for Qt widgets)
+from qgis.PyQt.QtWidgets import QApplication  # noqa: E402
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+from qgis.PyQt.QtCore import QModelIndex, qInstallMessageHandler  # noqa: E402
+
+from oqtopus.gui.roles_manage_dialog import (  # noqa: E402
+    _GROUP_SUFFIX_ROLE,
+    _ROLE_STATUS_ROLE,
+    _USER_NAME,
+    RolesManageDialog,
+    RolesTreeModel,
+    _RoleNode,
+)
+from oqtopus.libs.pum.role_manager import (  # noqa: E402
+    PermissionType,
+    Role,
+    RoleInventory,
+    RoleStatus,
+    SchemaPermissionStatus,
+)
+
+# The standalone shim doesn't map QtTest, import it from the binding in use
+QtTest = importlib.import_module(
+    sys.modules["qgis.PyQt.QtCore"].__name__.rsplit(".", 1)[0] + ".QtTest"
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _find_row(model, name, parent=QModelIndex()):
+    """Return the column 0 index of the first row displaying *name*."""
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        if index.data() == name:
+            return index
+        found = _find_row(model, name, index)
+        if found is not None:
+            return found
+    return None
+
+
+def _inventory():
+    viewer = Role("viewer", [])
+    viewer_status = RoleStatus(
+        "viewer",
+        role=viewer,
+        schema_permissions=[SchemaPermissionStatus("s1", PermissionType.READ, True)],
+    )
+    viewer_lau_status = RoleStatus(
+        "viewer_lau",
+        role=viewer,
+        suffix="lau",
+        schema_permissions=[SchemaPermissionStatus("s1", PermissionType.READ, False)],
+    )
+    inventory = RoleInventory(
+        roles=[
+            viewer_status,
+            viewer_lau_status,
+            RoleStatus("alice", granted_to=["viewer"], login=True),
+        ],
+        expected_roles=["viewer", "editor"],
+        other_login_roles=["carol"],
+    )
+    return inventory, viewer_status, viewer_lau_status
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_roles_tree_model_passes_model_tester():
+    messages = []
+    previous_handler = qInstallMessageHandler(
+        lambda msg_type, context, message: messages.append(message)
+    )
+    try:
+        model = RolesTreeModel(["Role", "Status", "Login", "Details"])
+        QtTest.QAbstractItemModelTester(
+            model, QtTest.QAbstractItemModelTester.FailureReportingMode.Warning
+        )
+
+        root = _RoleNode(None, [])
+        header = _RoleNode(root, ["Module roles"], header=True)
+        group = _RoleNode(header, ["Generic roles"], header=True, group_suffix="")
+        _RoleNode(group, ["viewer", "ok", "no", "s1"], tooltip="s1: read")
+        _RoleNode(group, ["editor", "missing", "", ""])
+        users = _RoleNode(root, ["Users"], header=True)
+        _RoleNode(users, ["carol", "", "yes", ""], user_name="carol")
+        model.set_root(root)
+        model.set_root(_RoleNode(None, []))
+    finally:
+        qInstallMessageHandler(previous_handler)
+
+    assert not [message for message in messages if message.startswith("FAIL!")]
+
+
+def test_roles_tree_model_data():
+    model = RolesTreeModel(["Role", "Status", "Login", "Details"])
+    root = _RoleNode(None, [])
+    header = _RoleNode(root, ["Specific roles (lau)"], header=True, group_suffix="lau")
+    _RoleNode(header, ["carol", "", "yes", "no role"], tooltip="tip", user_name="carol")
+    model.set_root(root)
+
+    header_index = model.index(0, 0)
+    assert header_index.data(_GROUP_SUFFIX_ROLE) == "lau"
+    assert header_index.data(_ROLE_STATUS_ROLE) is None
+
+    details_index = model.index(0, 3, header_index)
+    assert details_index.parent() == header_index
+    assert details_index.data() == "no role"
+    assert details_index.siblingAtColumn(0).data(_USER_NAME) == "carol"
+
+
+def test_dialog_role_status_lookup():
+    inventory, viewer_status, viewer_lau_status = _inventory()
+    dialog = RolesManageDialog(inventory)
+
+    assert dialog._collect_module_roles() == [
+        (viewer_status, "viewer"),
+        (viewer_lau_status, "viewer_lau"),
+    ]
+
+    # Context menu lookups go through the first column of the clicked row
+    model = dialog._tree.model()
+    for status in (viewer_status, viewer_lau_status):
+        index = _find_row(model, status.name)
+        details_index = index.siblingAtColumn(3)
+        assert details_index.siblingAtColumn(0).data(_ROLE_STATUS_ROLE) is status
+
+    # Missing roles have no status
+    assert _find_row(model, "editor").data(_ROLE_STATUS_ROLE) is None